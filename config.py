@@ -1,7 +1,14 @@
+import mmap
+import re
+from functools import cached_property, lru_cache
 from pathlib import Path
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+ENV_FILE = Path(__file__).parent / ".env"
+# Env files above this size are edited through mmap instead of being decoded whole.
+_ENV_MMAP_THRESHOLD = 8 * 1024
+
 
 class RiskLimits(BaseModel):
     max_position_pct: float = 0.10
@@ -35,7 +42,7 @@ class AggressiveRiskLimits(RiskLimits):
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
-        env_file=str(Path(__file__).parent / ".env"),
+        env_file=str(ENV_FILE),
         env_file_encoding="utf-8",
         extra="ignore",
     )
@@ -52,20 +59,80 @@ class Settings(BaseSettings):
     marketaux_api_key: str = ""
     fmp_api_key: str = ""
 
-    @property
+    # Derived values are computed once per Settings instance; trading_mode is
+    # fixed for the life of the process (set from --mode before first use).
+    @cached_property
     def user_key(self) -> str:
         if self.trading_mode == "real":
             return self.etoro_user_key_real
         return self.etoro_user_key_demo
 
-    @property
+    @cached_property
     def api_base(self) -> str:
         return "https://public-api.etoro.com"
 
-    @property
+    @cached_property
     def mode_prefix(self) -> str:
         """Path prefix for demo vs real trading endpoints."""
         return "demo/" if self.trading_mode == "demo" else ""
 
 
-settings = Settings()
+def set_env_value(key: str, value: str, path: Path = ENV_FILE) -> None:
+    """Set ``KEY = value`` in an env file, replacing the first exact-key line
+    or appending one. Keys sharing a prefix (``KEY_X``) are left alone."""
+    line = f"{key} = {value}"
+    if path.stat().st_size > _ENV_MMAP_THRESHOLD:
+        _set_env_line_mmap(path, key, line.encode())
+        return
+    # newline="" keeps CRLF files as they are, like the byte-level mmap path.
+    with path.open(newline="") as f:
+        text = f.read()
+    pattern = re.compile(rf"^[ \t]*{re.escape(key)}[ \t]*=[^\r\n]*", re.M)
+    text, count = pattern.subn(lambda _: line, text, count=1)
+    if not count:
+        if text and not text.endswith("\n"):
+            text += "\n"
+        text += line + "\n"
+    with path.open("w", newline="") as f:
+        f.write(text)
+
+
+def _set_env_line_mmap(path: Path, key: str, line: bytes) -> None:
+    """Byte-level ``set_env_value`` for large files.
+
+    The key is located in the mapped file without decoding it; a same-length
+    replacement is written in place, otherwise only the tail is rewritten.
+    """
+    pattern = re.compile(rb"^[ \t]*" + re.escape(key.encode()) + rb"[ \t]*=[^\r\n]*", re.M)
+    with path.open("r+b") as f:
+        with mmap.mmap(f.fileno(), 0) as mm:
+            match = pattern.search(mm)
+            if match is None:
+                needs_newline = mm[-1:] != b"\n"
+            elif match.end() - match.start() == len(line):
+                mm[match.start():match.end()] = line
+                mm.flush()
+                return
+            else:
+                start, tail = match.start(), mm[match.end():]
+        if match is None:
+            f.seek(0, 2)
+            f.write((b"\n" if needs_newline else b"") + line + b"\n")
+        else:
+            f.seek(start)
+            f.write(line + tail)
+            f.truncate()
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the Settings singleton on first use (reads .env and the environment)."""
+    return Settings()
+
+
+def __getattr__(name: str):
+    # ``from config import settings`` keeps working but defers the .env read
+    # and validation until something actually asks for it.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import importlib.util
+import json
+import threading
 import time
 import uuid
 from typing import Any
@@ -9,20 +12,44 @@ from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_excep
 
 from config import settings
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # optional speedup; stdlib json decodes the same payloads
+    json_loads = json.loads
+
+# HTTP/2 needs the optional ``h2`` package (httpx[http2]); fall back to
+# HTTP/1.1 keep-alive when it is not installed.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+# Sized for the concurrent market-data fan-out; idle connections stay warm.
+POOL_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=20, keepalive_expiry=60.0
+)
+
 
 class _RateLimiter:
-    """Simple token-bucket rate limiter (5 req/s)."""
+    """Token-bucket rate limiter (5 req/s, bursts of up to 5), thread-safe.
 
-    def __init__(self, rate: float = 5.0):
-        self._min_interval = 1.0 / rate
-        self._last = 0.0
+    Each call reserves a token under the lock and sleeps outside it, so
+    concurrent callers queue up at the configured rate instead of racing.
+    The balance may go negative; that debt is the wait for later callers.
+    """
 
-    def wait(self) -> None:
-        now = time.monotonic()
-        elapsed = now - self._last
-        if elapsed < self._min_interval:
-            time.sleep(self._min_interval - elapsed)
+    def __init__(self, rate: float = 5.0, capacity: float = 5.0):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
         self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+            self._tokens -= 1.0
+            delay = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if delay > 0:
+            time.sleep(delay)
 
 
 class EtoroClient:
@@ -32,6 +59,8 @@ class EtoroClient:
             base_url=settings.api_base,
             timeout=30.0,
             follow_redirects=True,
+            http2=HTTP2_AVAILABLE,
+            limits=POOL_LIMITS,
             headers=self._base_headers(),
         )
 
@@ -69,11 +98,11 @@ class EtoroClient:
 
     def get(self, path: str, **params: Any) -> Any:
         resp = self._request("GET", path, params=params or None)
-        return resp.json()
+        return json_loads(resp.content)
 
     def post(self, path: str, body: dict[str, Any]) -> Any:
         resp = self._request("POST", path, json_body=body)
-        return resp.json()
+        return json_loads(resp.content)
 
     def close(self) -> None:
         self._client.close()
@@ -15,23 +15,35 @@ INSTRUMENT_RATES = "/api/v1/market-data/instruments/rates"
 CANDLES = "/api/v1/market-data/instruments/{instrument_id}/history/candles/{direction}/{period}/{count}"
 
 # ── Portfolio / Account ───────────────────────────────────────────────
+# trading_mode is fixed for the process, so mode-prefixed paths are built once.
+
+_INFO = f"/api/v1/trading/info/{settings.mode_prefix}"
+_EXECUTION = f"/api/v1/trading/execution/{settings.mode_prefix}"
+
+PORTFOLIO_PATH = f"{_INFO}portfolio"
+
 
 def portfolio_path() -> str:
-    return f"/api/v1/trading/info/{settings.mode_prefix}portfolio"
+    return PORTFOLIO_PATH
 
 
 # ── Trading Execution ─────────────────────────────────────────────────
 
+OPEN_TRADE_PATH = f"{_EXECUTION}market-open-orders/by-amount"
+LIMIT_ORDER_PATH = f"{_EXECUTION}limit-orders"
+_CLOSE_TRADE_PREFIX = f"{_EXECUTION}market-close-orders/positions/"
+
+
 def open_trade_path() -> str:
-    return f"/api/v1/trading/execution/{settings.mode_prefix}market-open-orders/by-amount"
+    return OPEN_TRADE_PATH
 
 
 def close_trade_path(position_id: int) -> str:
-    return f"/api/v1/trading/execution/{settings.mode_prefix}market-close-orders/positions/{position_id}"
+    return f"{_CLOSE_TRADE_PREFIX}{position_id}"
 
 
 def limit_order_path() -> str:
-    return f"/api/v1/trading/execution/{settings.mode_prefix}limit-orders"
+    return LIMIT_ORDER_PATH
 
 
 # ── Watchlists ────────────────────────────────────────────────────────
@@ -0,0 +1,41 @@
+"""Typer application behind cli.py — imported only when a command is dispatched.
+
+Each command group lives in its own module under ``src/cli/``; ``build_app``
+imports just the group being invoked, or all of them for top-level help.
+"""
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Optional
+
+import typer
+
+from src.cli.common import console, mod
+from src.cli.groups import APP_HELP, COMMAND_GROUPS
+
+# Groups that never touch the database; skip init_db for them.
+_NO_DB_GROUPS = frozenset({"config"})
+
+
+def main_callback(
+    ctx: typer.Context,
+    mode: Optional[str] = typer.Option(None, "--mode", help="Trading mode: demo or real"),
+):
+    if mode is not None and mode not in ("demo", "real"):
+        console.print("[red]--mode must be 'demo' or 'real'[/red]")
+        raise typer.Exit(1)
+    # Click runs this callback before the subcommand parses --help.
+    if ctx.invoked_subcommand in _NO_DB_GROUPS or "--help" in sys.argv[1:]:
+        return
+    database = mod("src.storage.database")
+    database.init_db()
+
+
+def build_app(group: str | None = None) -> typer.Typer:
+    """Assemble the Typer app with ``group`` only, or every group when None."""
+    app = typer.Typer(help=APP_HELP)
+    app.callback()(main_callback)
+    for name in [group] if group else COMMAND_GROUPS:
+        app.add_typer(importlib.import_module(f"src.cli.{name}").app, name=name)
+    return app
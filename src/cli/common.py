@@ -0,0 +1,131 @@
+"""Shared console, styles, options and output helpers for the CLI command groups."""
+from __future__ import annotations
+
+import functools
+import importlib
+import re
+import sys
+from collections.abc import Mapping
+
+import typer
+from rich.console import Console
+from rich.style import Style
+from rich.table import Table
+from rich.text import Text
+
+from src.cli.json_output import dumps_json
+
+# Highlighting and emoji parsing are off: output is mostly numbers and
+# symbols, and re-lexing every line costs more than it adds.
+console = Console(highlight=False, soft_wrap=True, emoji=False)
+
+# Prebuilt styles for per-cell colouring; avoids re-parsing markup per row.
+GREEN = Style(color="green")
+RED = Style(color="red")
+WHITE = Style(color="white")
+BOLD = Style(bold=True)
+
+# Options shared by several commands, built once and reused.
+FORMAT_OPTION = typer.Option("table", help="Output format: table or json")
+LEVERAGE_OPTION = typer.Option(1.0, help="Leverage")
+SL_OPTION = typer.Option(None, help="Stop loss %")
+TP_OPTION = typer.Option(None, help="Take profit %")
+REASON_OPTION = typer.Option(None, help="Trade reason")
+DIRECTION_OPTION = typer.Option("BUY", help="BUY or SELL")
+RECORDS_OPTION = typer.Option(50, help="Number of records")
+
+
+class PlainTable:
+    """Tab-separated stand-in for ``rich.Table`` when stdout is not a terminal.
+
+    Rows are written as they are added, so piped output needs no width
+    computation and stays friendly to ``cut``/``awk``.
+    """
+
+    def __init__(self, cols) -> None:
+        print("\t".join(col[0] for col in cols))
+
+    def add_row(self, *cells) -> None:
+        print("\t".join(str(cell) for cell in cells))
+
+
+def mk_table(cols) -> Table | PlainTable:
+    """Table with a bold header built from ``(header, justify[, width])`` specs.
+
+    Returns a ``PlainTable`` when output is piped or redirected.
+    """
+    if not console.is_terminal:
+        return PlainTable(cols)
+    table = Table(show_header=True, header_style=BOLD)
+    for name, justify, *width in cols:
+        table.add_column(name, justify=justify or "left", width=width[0] if width else None)
+    return table
+
+
+def print_table(table: Table | PlainTable) -> None:
+    """Render a table from ``mk_table``; plain tables have already been written."""
+    if isinstance(table, Table):
+        console.print(table)
+
+
+@functools.lru_cache(maxsize=None)
+def mod(name: str):
+    """Import a backend module on first use; later lookups hit the cache."""
+    return importlib.import_module(name)
+
+
+def emit_json(obj) -> None:
+    """Write ``obj`` as indented JSON straight to stdout."""
+    payload = dumps_json(obj)
+    sys.stdout.flush()
+    sys.stdout.buffer.write(payload + b"\n")
+    sys.stdout.buffer.flush()
+
+
+# Long histories are streamed line by line with fixed-width columns so the
+# first row appears immediately; Rich's Table is kept for small, bounded views.
+# Columns are ``(label, key, format spec)``: the spec formats the row value,
+# and its alignment and width also place the header label. When stdout is not
+# a terminal, rows are tab-separated like ``PlainTable``.
+
+StreamCols = tuple[tuple[str, str, str], ...]
+
+
+def _layout(spec: str) -> str:
+    """Alignment and width prefix of a format spec (``">14,.2f"`` -> ``">14"``)."""
+    return re.match(r"[<>^]?\d*", spec).group()
+
+
+@functools.lru_cache(maxsize=None)
+def _row_template(cols: StreamCols, plain: bool) -> str:
+    if plain:
+        return "\t".join(f"{{{key}:{spec[len(_layout(spec)):]}}}" for _, key, spec in cols)
+    return "  ".join(f"{{{key}:{spec}}}" for _, key, spec in cols)
+
+
+def stream_header(cols: StreamCols) -> None:
+    if not console.is_terminal:
+        print("\t".join(label for label, _, _ in cols))
+        return
+    console.rule()
+    console.print(
+        "  ".join(f"{label:{_layout(spec)}}" for label, _, spec in cols),
+        style=BOLD,
+        markup=False,
+    )
+    console.rule()
+
+
+def stream_row(cols: StreamCols, row: Mapping, styles: Mapping[str, Style] | None = None) -> None:
+    """Write one listing row; ``styles`` colours individual cells on a terminal."""
+    if not console.is_terminal:
+        print(_row_template(cols, True).format_map(row))
+    elif not styles:
+        console.print(_row_template(cols, False).format_map(row), markup=False)
+    else:
+        parts: list = []
+        for _, key, spec in cols:
+            if parts:
+                parts.append("  ")
+            parts.append((format(row[key], spec), styles.get(key, "")))
+        console.print(Text.assemble(*parts))
@@ -0,0 +1,50 @@
+"""``config`` command group."""
+from __future__ import annotations
+
+import typer
+
+from src.cli.common import console, mod
+from src.cli.groups import COMMAND_GROUPS
+
+app = typer.Typer(help=COMMAND_GROUPS["config"])
+
+
+@app.command("show")
+def config_show():
+    """Show current configuration."""
+    settings = mod("config").get_settings()
+    console.print(f"\n[bold]Configuration[/bold]")
+    console.print(f"  Trading Mode:   {settings.trading_mode}")
+    console.print(f"  API Base:       {settings.api_base}")
+    console.print(f"  DB Path:        {settings.db_path}")
+    console.print(f"\n[bold]Risk Limits[/bold]")
+    console.print(f"  Max position:       {settings.risk.max_position_pct:.0%}")
+    console.print(f"  Max exposure:       {settings.risk.max_total_exposure_pct:.0%}")
+    console.print(f"  Max daily loss:     {settings.risk.max_daily_loss_pct:.0%}")
+    console.print(f"  Max single trade:   ${settings.risk.max_single_trade_usd:,.0f}")
+    console.print(f"  Min trade:          ${settings.risk.min_trade_usd:,.0f}")
+    console.print(f"  Max open positions: {settings.risk.max_open_positions}")
+    console.print(f"  Default SL:         {settings.risk.default_stop_loss_pct}%")
+    console.print(f"  Default TP:         {settings.risk.default_take_profit_pct}%")
+    console.print(f"  Max leverage:       {settings.risk.max_leverage}x")
+
+
+@app.command("set")
+def config_set(
+    key: str = typer.Argument(..., help="Config key (e.g. trading_mode)"),
+    value: str = typer.Argument(..., help="New value"),
+):
+    """Update a configuration value in .env file."""
+    cfg = mod("config")
+    if not cfg.ENV_FILE.exists():
+        console.print("[red].env file not found[/red]")
+        raise typer.Exit(1)
+
+    key_upper = key.upper()
+    if key_upper == "TRADING_MODE":
+        if value not in ("demo", "real"):
+            console.print("[red]trading_mode must be 'demo' or 'real'[/red]")
+            raise typer.Exit(1)
+
+    cfg.set_env_value(key_upper, value)
+    console.print(f"Set {key_upper} = {value}")
@@ -0,0 +1,17 @@
+"""Top-level command groups.
+
+Kept free of third-party imports so ``cli.py`` can render the top-level help
+without loading Typer, Rich, or the settings/database stack.
+"""
+
+COMMAND_GROUPS: dict[str, str] = {
+    "portfolio": "Portfolio management",
+    "market": "Market data & analysis",
+    "trade": "Trading operations",
+    "history": "Trade history",
+    "memory": "Persistent memories",
+    "watchlist": "Watchlists",
+    "config": "Configuration",
+}
+
+APP_HELP = "eToro Trading Toolkit CLI"
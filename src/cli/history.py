@@ -0,0 +1,73 @@
+"""``history`` command group."""
+from __future__ import annotations
+
+from itertools import chain
+
+import typer
+
+from src.cli.common import (
+    GREEN,
+    RECORDS_OPTION,
+    RED,
+    WHITE,
+    console,
+    mod,
+    stream_header,
+    stream_row,
+)
+from src.cli.groups import COMMAND_GROUPS
+
+app = typer.Typer(help=COMMAND_GROUPS["history"])
+
+_STATUS_STYLE = {"executed": GREEN, "rejected": RED, "error": RED}
+
+# Streamed listing columns: (label, key, format spec).
+_TRADE_COLS = (
+    ("Time", "timestamp", "<19.19"),
+    ("Symbol", "symbol", "<8"),
+    ("Dir", "direction", "<4"),
+    ("Amount ($)", "amount", ">12,.2f"),
+    ("Status", "status", "<8"),
+    ("Reason", "reason", ".40"),
+)
+_RUN_COLS = (
+    ("Time", "timestamp", "<19.19"),
+    ("Value ($)", "total_value", ">14,.2f"),
+    ("P&L ($)", "total_pnl", ">12,.2f"),
+    ("Positions", "num_positions", ">9"),
+)
+# Only the fields the rows show; skips the JSON payload columns.
+_TRADE_COLUMNS = tuple(key for _, key, _ in _TRADE_COLS)
+_RUN_COLUMNS = tuple(key for _, key, _ in _RUN_COLS)
+
+
+@app.command("trades")
+def history_trades(limit: int = RECORDS_OPTION):
+    """Show trade history."""
+    repos = mod("src.storage.repositories")
+    repo = repos.TradeLogRepo()
+    trades = repo.iter_trades(limit, columns=_TRADE_COLUMNS)
+    first = next(trades, None)
+    if first is None:
+        console.print("No trade history.")
+        return
+
+    stream_header(_TRADE_COLS)
+    for t in chain((first,), trades):
+        t["reason"] = t["reason"] or ""
+        stream_row(_TRADE_COLS, t, {"status": _STATUS_STYLE.get(t["status"], WHITE)})
+
+
+@app.command("runs")
+def history_runs(limit: int = typer.Option(20, help="Number of records")):
+    """Show portfolio snapshot history (analysis runs)."""
+    repos = mod("src.storage.repositories")
+    repo = repos.PortfolioRepo()
+    snaps = repo.get_snapshots(limit, columns=_RUN_COLUMNS)
+    if not snaps:
+        console.print("No snapshots.")
+        return
+
+    stream_header(_RUN_COLS)
+    for s in snaps:
+        stream_row(_RUN_COLS, s)
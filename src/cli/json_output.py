@@ -0,0 +1,52 @@
+"""JSON encoding for ``--format json`` output.
+
+Kept free of Typer/Rich so it can be imported (and tested) on its own.
+orjson is used when installed; the stdlib fallback is tuned to produce the
+same document: datetimes as naive ISO strings, numpy scalars as numbers,
+NaN/inf as null.
+"""
+from __future__ import annotations
+
+import datetime as dt
+import json
+import math
+
+
+def _default(obj):
+    """Hook for values neither encoder handles natively."""
+    if isinstance(obj, (dt.date, dt.time)):
+        return obj.isoformat()
+    item = getattr(obj, "item", None)  # numpy scalars
+    if callable(item):
+        value = item()
+        if isinstance(value, float) and not math.isfinite(value):
+            return None
+        return value
+    return str(obj)
+
+
+def _finite(obj):
+    """Replace non-finite floats with None; the stdlib would write bare NaN."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(v) for v in obj]
+    return obj
+
+
+def dumps_json(obj) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON indented by two spaces."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(
+            _finite(obj), default=_default, indent=2, ensure_ascii=False
+        ).encode()
+    return orjson.dumps(
+        obj,
+        default=_default,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SERIALIZE_NUMPY,
+    )
@@ -0,0 +1,375 @@
+"""``market`` command group."""
+from __future__ import annotations
+
+import sys
+
+import typer
+
+from src.cli.common import (
+    FORMAT_OPTION,
+    console,
+    emit_json,
+    mk_table,
+    mod,
+    print_table,
+)
+from src.cli.groups import COMMAND_GROUPS
+
+app = typer.Typer(help=COMMAND_GROUPS["market"])
+
+_TREND_COLOR = {"BULLISH": "green", "BEARISH": "red", "NEUTRAL": "yellow"}
+_MA_COLOR = {"GOLDEN": "green", "MOSTLY_BULLISH": "green", "DEATH": "red", "MOSTLY_BEARISH": "red"}
+_PRICE_COLS = (
+    ("Symbol", None),
+    ("Bid", "right"),
+    ("Ask", "right"),
+    ("Mid", "right"),
+    ("Spread %", "right"),
+)
+_SEARCH_COLS = (("ID", None), ("Symbol", None), ("Name", None), ("Type", None))
+_NEWS_COLS = (("Date", None, 12), ("Source", None, 15), ("Headline", None))
+_GRADE_COLS = (("Date", None, 12), ("Firm", None), ("Action", None), ("From", None), ("To", None))
+_CANDLE_COLS = (
+    ("Date", None),
+    ("Open", "right"),
+    ("High", "right"),
+    ("Low", "right"),
+    ("Close", "right"),
+    ("Volume", "right"),
+)
+_CANDLE_ROW = "{!s:.16}\t{:,.4f}\t{:,.4f}\t{:,.4f}\t{:,.4f}\t{:,.0f}"
+
+
+@app.command("price")
+def market_price(symbols: list[str] = typer.Argument(..., help="Symbols to check")):
+    """Get current prices for instruments."""
+    market_data = mod("src.market.data")
+
+    infos = market_data.resolve_symbols(symbols)
+    for sym in symbols:
+        if sym not in infos:
+            console.print(f"  [red]'{sym}' not found[/red]")
+    symbol_map = {info["instrument_id"]: sym for sym, info in infos.items()}
+    instrument_ids = list(symbol_map)
+
+    if not instrument_ids:
+        return
+
+    rates = market_data.get_rates(instrument_ids)
+    table = mk_table(_PRICE_COLS)
+
+    for r in rates:
+        table.add_row(
+            symbol_map.get(r.instrument_id, str(r.instrument_id)),
+            f"${r.bid:,.4f}",
+            f"${r.ask:,.4f}",
+            f"${r.mid:,.4f}",
+            f"{r.spread_pct:.4f}%",
+        )
+    print_table(table)
+
+
+@app.command("analyze")
+def market_analyze(
+    symbols: list[str] = typer.Argument(None, help="Symbols to analyze"),
+    all: bool = typer.Option(False, "--all", help="Analyze all portfolio positions"),
+    format: str = FORMAT_OPTION,
+):
+    """Technical analysis of instruments."""
+    market_data = mod("src.market.data")
+
+    if all:
+        manager = mod("src.portfolio.manager")
+        positions = manager.get_positions_with_symbols()
+        symbols = list({p["symbol"] for p in positions})
+        if not symbols:
+            console.print("No positions in portfolio.")
+            return
+
+    if not symbols:
+        console.print("Specify symbols or use --all")
+        raise typer.Exit(1)
+
+    # One lookup and one rates request for the batch; candles fan out.
+    results = market_data.analyze_many(
+        symbols, on_done=lambda sym: console.print(f"  Analyzed {sym}", style="dim")
+    )
+
+    if format == "json":
+        emit_json(results)
+        return
+
+    for r in results:
+        if "error" in r and not r.get("price"):
+            console.print(f"\n[red]{r.get('symbol', '?')}: {r['error']}[/red]")
+            continue
+
+        trend_color = _TREND_COLOR.get(r.get("trend", ""), "white")
+        console.print(f"\n[bold]{r['symbol']}[/bold] - {r.get('name', '')}")
+        console.print(f"  Price:   ${r['price']:,.4f}")
+        if r.get("spread_pct") is not None:
+            console.print(f"  Spread:  {r['spread_pct']:.4f}%")
+        console.print(f"  Trend:   [{trend_color}]{r['trend']}[/{trend_color}]")
+        console.print(f"  RSI:     {r['rsi']}")
+        console.print(f"  MACD:    line={r['macd']['line']}  signal={r['macd']['signal']}  hist={r['macd']['histogram']}")
+        console.print(f"  BB:      upper={r['bollinger']['upper']}  mid={r['bollinger']['middle']}  lower={r['bollinger']['lower']}")
+        sma200_str = f"  200={r['sma_200']}" if r.get("sma_200") else ""
+        console.print(f"  SMA:     20={r['sma_20']}  50={r['sma_50']}{sma200_str}")
+        console.print(f"  EMA:     8={r.get('ema_8', 'N/A')}  12={r['ema_12']}  21={r.get('ema_21', 'N/A')}  26={r['ema_26']}")
+        console.print(f"  ATR:     {r['atr']}")
+        if r.get("rvol") is not None:
+            rvol_val = r["rvol"]
+            rvol_color = "green" if rvol_val >= 1.5 else "red" if rvol_val < 0.5 else "white"
+            console.print(f"  RVOL:    [{rvol_color}]{rvol_val:.2f}x[/{rvol_color}]")
+        if r.get("ma_alignment"):
+            ma = r["ma_alignment"]
+            ma_color = _MA_COLOR.get(ma["status"], "yellow")
+            console.print(f"  MA:      [{ma_color}]{ma['status']}[/{ma_color}] (bull={ma['bullish_layers']} bear={ma['bearish_layers']})")
+        if r.get("gap_pct") and abs(r["gap_pct"]) >= 0.5:
+            gap_color = "green" if r["gap_pct"] > 0 else "red"
+            console.print(f"  Gap:     [{gap_color}]{r['gap_pct']:+.2f}%[/{gap_color}]")
+        if r.get("chandelier"):
+            ch = r["chandelier"]
+            trend_gate = "[green]TSL OK[/green]" if ch["trend_up"] else "[yellow]trend bearish[/yellow]"
+            console.print(
+                f"  TSL:     stop=${ch['long_stop']:,.4f}  "
+                f"ST=${ch['supertrend']:,.4f}  {trend_gate}"
+            )
+        if r.get("signals"):
+            console.print(f"  Signals: {', '.join(r['signals'])}")
+
+
+@app.command("search")
+def market_search(query: str = typer.Argument(..., help="Search query")):
+    """Search for instruments."""
+    market_data = mod("src.market.data")
+    results = market_data.search_instrument(query)
+    if not results:
+        console.print("No results found.")
+        return
+
+    table = mk_table(_SEARCH_COLS)
+
+    for r in results:
+        table.add_row(
+            str(r.get("instrument_id", "")),
+            r.get("symbol", ""),
+            r.get("name", ""),
+            str(r.get("type", "")),
+        )
+    print_table(table)
+
+
+@app.command("fundamentals")
+def market_fundamentals(
+    symbol: str = typer.Argument(..., help="Instrument symbol"),
+    format: str = FORMAT_OPTION,
+):
+    """Fundamental analysis of an instrument."""
+    fundamentals = mod("src.market.fundamentals")
+
+    data = fundamentals.get_instrument_fundamentals(symbol)
+    if "error" in data:
+        console.print(f"[red]{data['error']}[/red]")
+        raise typer.Exit(1)
+
+    if format == "json":
+        emit_json(data)
+        return
+
+    console.print(f"\n[bold]{data['symbol']}[/bold] - {data.get('name', '')}")
+
+    # Valuation
+    v = data.get("valuation") or {}
+    console.print(f"\n[bold]Valuation[/bold]")
+    if (pe_ratio := v.get("pe_ratio")) is not None:
+        console.print(f"  P/E Ratio:      {pe_ratio:.2f}")
+    if (price_to_book := v.get("price_to_book")) is not None:
+        console.print(f"  Price/Book:     {price_to_book:.2f}")
+    if (price_to_sales := v.get("price_to_sales")) is not None:
+        console.print(f"  Price/Sales:    {price_to_sales:.2f}")
+    if (mc := v.get("market_cap")) is not None:
+        if mc >= 1e12:
+            console.print(f"  Market Cap:     ${mc/1e12:.2f}T")
+        elif mc >= 1e9:
+            console.print(f"  Market Cap:     ${mc/1e9:.2f}B")
+        else:
+            console.print(f"  Market Cap:     ${mc/1e6:.0f}M")
+
+    # Profitability
+    p = data.get("profitability") or {}
+    console.print(f"\n[bold]Profitability[/bold]")
+    if (eps := p.get("eps")) is not None:
+        console.print(f"  EPS (TTM):      ${eps:.2f}")
+    if (eps_growth_1y := p.get("eps_growth_1y")) is not None:
+        console.print(f"  EPS Growth 1Y:  {eps_growth_1y:.1f}%")
+    if (net_profit_margin := p.get("net_profit_margin")) is not None:
+        console.print(f"  Net Margin:     {net_profit_margin:.1f}%")
+    if (return_on_equity := p.get("return_on_equity")) is not None:
+        console.print(f"  ROE:            {return_on_equity:.1f}%")
+
+    # Analyst Ratings
+    a = data.get("analyst_ratings") or {}
+    console.print(f"\n[bold]Analyst Ratings[/bold]")
+    if consensus := a.get("consensus"):
+        console.print(f"  Consensus:      {consensus}")
+    if (target_price := a.get("target_price")) is not None:
+        upside = a.get("target_upside")
+        upside_str = f" ({upside:+.1f}%)" if upside is not None else ""
+        console.print(f"  Target Price:   ${target_price:.2f}{upside_str}")
+    if (buy_count := a.get("buy_count")) is not None:
+        console.print(f"  Buy/Hold/Sell:  {buy_count}/{a.get('hold_count', 0)}/{a.get('sell_count', 0)}")
+
+    # Sentiment
+    s = data.get("sentiment") or {}
+    console.print(f"\n[bold]eToro Sentiment[/bold]")
+    if (buy_pct := s.get("buy_pct")) is not None:
+        console.print(f"  Buy:            {buy_pct:.1f}%")
+    if (sell_pct := s.get("sell_pct")) is not None:
+        console.print(f"  Sell:           {sell_pct:.1f}%")
+
+    # Dividends
+    d = data.get("dividends") or {}
+    if (dividend_yield := d.get("dividend_yield")) is not None:
+        console.print(f"\n[bold]Dividends[/bold]")
+        console.print(f"  Yield:          {dividend_yield:.2f}%")
+        if ex_date := d.get("ex_date"):
+            console.print(f"  Ex-Date:        {ex_date}")
+
+    # Earnings
+    e = data.get("earnings") or {}
+    if next_date := e.get("next_earnings_date"):
+        console.print(f"\n[bold]Earnings[/bold]")
+        console.print(f"  Next Report:    {next_date}")
+        if (days := e.get("days_till_earnings")) is not None:
+            console.print(f"  Days Until:     {days}")
+
+    # ESG
+    esg = data.get("esg") or {}
+    if (total := esg.get("total")) is not None:
+        console.print(f"\n[bold]ESG Scores[/bold]")
+        console.print(f"  Total:          {total:.1f}")
+        if (environment := esg.get("environment")) is not None:
+            console.print(f"  Environment:    {environment:.1f}")
+        if (social := esg.get("social")) is not None:
+            console.print(f"  Social:         {social:.1f}")
+        if (governance := esg.get("governance")) is not None:
+            console.print(f"  Governance:     {governance:.1f}")
+
+
+@app.command("news")
+def market_news(
+    symbol: str = typer.Argument(..., help="Instrument symbol"),
+    limit: int = typer.Option(10, help="Max articles to show"),
+    format: str = FORMAT_OPTION,
+):
+    """Get news, analyst grades, and price targets for an instrument."""
+    news = mod("src.market.news")
+
+    data = news.get_all_news(symbol)
+    if "error" in data and len(data) == 1:
+        console.print(f"[red]{data['error']}[/red]")
+        raise typer.Exit(1)
+
+    if format == "json":
+        emit_json(data)
+        return
+
+    console.print(f"\n[bold]News: {data.get('symbol', symbol)}[/bold]")
+
+    # Articles
+    articles = data.get("articles", [])
+    if articles:
+        console.print(f"\n[bold]Recent Articles[/bold] ({data.get('article_count', len(articles))} total)")
+        table = mk_table(_NEWS_COLS)
+
+        for a in articles[:limit]:
+            dt = (a.get("datetime") or "")[:10]
+            table.add_row(dt, a.get("source", ""), a.get("headline", ""))
+        print_table(table)
+
+    # Sentiment
+    sentiment = data.get("sentiment")
+    if sentiment and "error" not in sentiment:
+        console.print(f"\n[bold]Sentiment[/bold]")
+        bull = sentiment.get("bullish_percent", 0)
+        bear = sentiment.get("bearish_percent", 0)
+        score = sentiment.get("company_news_score", 0)
+        console.print(f"  Bullish: {bull:.0%}  Bearish: {bear:.0%}  News Score: {score:.2f}")
+        console.print(f"  Articles last week: {sentiment.get('articles_in_last_week', 0)}")
+
+    # Analyst grades
+    grades = data.get("analyst_grades", [])
+    if grades:
+        console.print(f"\n[bold]Analyst Grades[/bold]")
+        table = mk_table(_GRADE_COLS)
+
+        for g in grades[:limit]:
+            table.add_row(
+                (g.get("date") or "")[:10],
+                g.get("firm", ""),
+                g.get("action", ""),
+                g.get("from_grade", ""),
+                g.get("to_grade", ""),
+            )
+        print_table(table)
+
+    # Price targets
+    targets = data.get("price_targets")
+    if targets and "error" not in targets:
+        console.print(f"\n[bold]Price Target Consensus[/bold]")
+        console.print(f"  Average: ${targets.get('target_average', 0):,.2f}")
+        console.print(f"  Median:  ${targets.get('target_median', 0):,.2f}")
+        console.print(f"  High:    ${targets.get('target_high', 0):,.2f}")
+        console.print(f"  Low:     ${targets.get('target_low', 0):,.2f}")
+
+    # Marketaux articles
+    mx_articles = data.get("marketaux_articles", [])
+    if mx_articles:
+        console.print(f"\n[bold]Additional News (Marketaux)[/bold]")
+        for a in mx_articles[:5]:
+            ents = a.get("entities")
+            entities_str = ", ".join(
+                f"{e['symbol']}({e.get('sentiment_score', '?')})" for e in ents
+            ) if ents else ""
+            console.print(f"  - {a.get('title', '')} [{entities_str}]")
+
+    # Show errors for APIs that failed
+    for key in ("articles_error", "sentiment_error", "grades_error",
+                "targets_error", "marketaux_error"):
+        if key in data:
+            console.print(f"\n[dim]{key}: {data[key]}[/dim]")
+
+
+@app.command("candles")
+def market_candles(
+    symbol: str = typer.Argument(..., help="Instrument symbol"),
+    interval: str = typer.Option("D1", help="Interval: M1,M5,M15,M30,H1,H4,D1,W1"),
+    count: int = typer.Option(20, help="Number of candles"),
+    format: str = FORMAT_OPTION,
+):
+    """Fetch OHLCV candles."""
+    market_data = mod("src.market.data")
+
+    info = market_data.resolve_symbol(symbol)
+    if not info:
+        console.print(f"[red]'{symbol}' not found[/red]")
+        raise typer.Exit(1)
+
+    api_interval = market_data.INTERVAL_MAP.get(interval.upper(), interval)
+    df = market_data.get_candles(info["instrument_id"], api_interval, count)
+
+    if df.empty:
+        console.print("No candle data.")
+        return
+
+    if format == "json":
+        sys.stdout.write(df.to_json(orient="records", date_format="iso", indent=2) + "\n")
+        return
+
+    table = mk_table(_CANDLE_COLS)
+
+    cols = ["timestamp", "open", "high", "low", "close", "volume"]
+    for row in df[cols].itertuples(index=False, name=None):
+        table.add_row(*_CANDLE_ROW.format(*row).split("\t"))
+    print_table(table)
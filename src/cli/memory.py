@@ -0,0 +1,71 @@
+"""``memory`` command group."""
+from __future__ import annotations
+
+from itertools import chain
+
+import typer
+
+from src.cli.common import RECORDS_OPTION, console, mod, stream_header, stream_row
+from src.cli.groups import COMMAND_GROUPS
+
+app = typer.Typer(help=COMMAND_GROUPS["memory"])
+
+# Streamed listing columns: (label, key, format spec).
+_MEMORY_COLS = (
+    ("ID", "id", ">5"),
+    ("Time", "timestamp", "<19.19"),
+    ("Category", "category", "<12"),
+    ("Content", "content", ".80"),
+)
+
+
+@app.command("list")
+def memory_list(limit: int = RECORDS_OPTION):
+    """List all memories."""
+    repos = mod("src.storage.repositories")
+    repo = repos.MemoryRepo()
+    memories = repo.iter_memories(limit)
+    first = next(memories, None)
+    if first is None:
+        console.print("No memories stored.")
+        return
+
+    stream_header(_MEMORY_COLS)
+    for m in chain((first,), memories):
+        stream_row(_MEMORY_COLS, m)
+
+
+@app.command("add")
+def memory_add(
+    category: str = typer.Argument(..., help="Category: lesson, pattern, market_note"),
+    content: str = typer.Argument(..., help="Memory content"),
+    relevance: float = typer.Option(1.0, help="Relevance score"),
+):
+    """Add a new memory."""
+    repos = mod("src.storage.repositories")
+    repo = repos.MemoryRepo()
+    mid = repo.add(category, content, relevance)
+    console.print(f"Memory saved (id={mid})")
+
+
+@app.command("search")
+def memory_search(query: str = typer.Argument(..., help="Search query")):
+    """Search memories."""
+    repos = mod("src.storage.repositories")
+    repo = repos.MemoryRepo()
+    results = repo.search(query)
+    if not results:
+        console.print("No matching memories.")
+        return
+
+    for m in results:
+        console.print(f"  [{m['category']}] {m['content']}")
+
+
+@app.command("delete")
+def memory_delete(memory_id: int = typer.Argument(..., help="Memory ID to delete")):
+    """Delete a memory."""
+    repos = mod("src.storage.repositories")
+    repo = repos.MemoryRepo()
+    repo.delete(memory_id)
+    console.print(f"Memory {memory_id} deleted.")
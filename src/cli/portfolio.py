@@ -0,0 +1,114 @@
+"""``portfolio`` command group."""
+from __future__ import annotations
+
+import typer
+from rich.text import Text
+
+from src.cli.common import (
+    FORMAT_OPTION,
+    GREEN,
+    RED,
+    console,
+    emit_json,
+    mk_table,
+    mod,
+    print_table,
+    stream_header,
+    stream_row,
+)
+from src.cli.groups import COMMAND_GROUPS
+
+app = typer.Typer(help=COMMAND_GROUPS["portfolio"])
+
+_POSITION_COLS = (
+    ("Symbol", None),
+    ("Direction", None),
+    ("Amount", "right"),
+    ("Open Rate", "right"),
+    ("P&L ($)", "right"),
+    ("P&L (%)", "right"),
+    ("Leverage", None),
+)
+
+# Streamed listing columns: (label, key, format spec).
+_SNAPSHOT_COLS = (
+    ("Time", "timestamp", "<19.19"),
+    ("Value ($)", "total_value", ">14,.2f"),
+    ("Invested ($)", "total_invested", ">14,.2f"),
+    ("P&L ($)", "total_pnl", ">12,.2f"),
+    ("Cash ($)", "cash_available", ">14,.2f"),
+    ("Pos", "num_positions", ">3"),
+)
+_SNAPSHOT_COLUMNS = tuple(key for _, key, _ in _SNAPSHOT_COLS)
+
+
+@app.callback(invoke_without_command=True)
+def portfolio_overview(
+    ctx: typer.Context,
+    format: str = FORMAT_OPTION,
+):
+    if ctx.invoked_subcommand is not None:
+        return
+    manager = mod("src.portfolio.manager")
+
+    portfolio = manager.get_portfolio()
+    positions = manager.get_positions_with_symbols(portfolio)
+
+    if format == "json":
+        data = {
+            "total_value": portfolio.total_value,
+            "total_invested": portfolio.total_invested,
+            "total_pnl": portfolio.total_pnl,
+            "cash_available": portfolio.cash_available,
+            "positions": positions,
+        }
+        emit_json(data)
+        return
+
+    console.print(f"\n[bold]Portfolio Overview[/bold]")
+    console.print(f"  Total Value:    ${portfolio.total_value:,.2f}")
+    console.print(f"  Invested:       ${portfolio.total_invested:,.2f}")
+    console.print(f"  P&L:            ${portfolio.total_pnl:,.2f}")
+    console.print(f"  Cash Available: ${portfolio.cash_available:,.2f}")
+    console.print(f"  Positions:      {len(positions)}\n")
+
+    if not positions:
+        console.print("  No open positions.")
+        return
+
+    table = mk_table(_POSITION_COLS)
+
+    for p in positions:
+        pnl_style = GREEN if p["net_profit"] >= 0 else RED
+        table.add_row(
+            p["symbol"],
+            p["direction"],
+            f"${p['amount']:,.2f}",
+            f"${p['open_rate']:,.4f}",
+            Text(f"${p['net_profit']:,.2f}", style=pnl_style),
+            Text(f"{p['pnl_pct']:,.2f}%", style=pnl_style),
+            f"{p['leverage']}x",
+        )
+    print_table(table)
+
+
+@app.command("snapshot")
+def portfolio_snapshot():
+    """Save current portfolio state to database."""
+    manager = mod("src.portfolio.manager")
+    sid = manager.save_snapshot()
+    console.print(f"Snapshot saved (id={sid})")
+
+
+@app.command("history")
+def portfolio_history(limit: int = typer.Option(20, help="Number of snapshots")):
+    """Show portfolio snapshot history."""
+    manager = mod("src.portfolio.manager")
+    snapshots = manager.get_snapshot_history(limit, columns=_SNAPSHOT_COLUMNS)
+    if not snapshots:
+        console.print("No snapshots yet.")
+        return
+
+    stream_header(_SNAPSHOT_COLS)
+    for s in snapshots:
+        stream_row(_SNAPSHOT_COLS, s)
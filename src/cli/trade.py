@@ -0,0 +1,166 @@
+"""``trade`` command group."""
+from __future__ import annotations
+
+import typer
+
+from src.cli.common import (
+    DIRECTION_OPTION,
+    FORMAT_OPTION,
+    LEVERAGE_OPTION,
+    REASON_OPTION,
+    SL_OPTION,
+    TP_OPTION,
+    console,
+    emit_json,
+    mod,
+)
+from src.cli.groups import COMMAND_GROUPS
+
+app = typer.Typer(help=COMMAND_GROUPS["trade"])
+
+
+@app.command("buy")
+def trade_buy(
+    symbol: str = typer.Argument(..., help="Instrument symbol"),
+    amount: float = typer.Argument(..., help="Amount in USD"),
+    sl: float = SL_OPTION,
+    tp: float = TP_OPTION,
+    leverage: float = LEVERAGE_OPTION,
+    reason: str = REASON_OPTION,
+):
+    """Open a BUY position."""
+    engine = mod("src.trading.engine")
+    result = engine.open_position(symbol, amount, "BUY", sl, tp, leverage, reason)
+    if result.success:
+        console.print(f"[green]{result.message}[/green]")
+        if result.position_id:
+            console.print(f"  Position ID: {result.position_id}")
+    else:
+        console.print(f"[red]FAILED: {result.message}[/red]")
+
+
+@app.command("sell")
+def trade_sell(
+    symbol: str = typer.Argument(..., help="Instrument symbol"),
+    amount: float = typer.Argument(..., help="Amount in USD"),
+    sl: float = SL_OPTION,
+    tp: float = TP_OPTION,
+    leverage: float = LEVERAGE_OPTION,
+    reason: str = REASON_OPTION,
+):
+    """Open a SELL (short) position."""
+    engine = mod("src.trading.engine")
+    result = engine.open_position(symbol, amount, "SELL", sl, tp, leverage, reason)
+    if result.success:
+        console.print(f"[green]{result.message}[/green]")
+        if result.position_id:
+            console.print(f"  Position ID: {result.position_id}")
+    else:
+        console.print(f"[red]FAILED: {result.message}[/red]")
+
+
+@app.command("close")
+def trade_close(
+    position_id: int = typer.Argument(..., help="Position ID to close"),
+    instrument_id: int = typer.Option(None, help="Instrument ID (auto-detected from portfolio if omitted)"),
+    reason: str = typer.Option(None, help="Close reason"),
+):
+    """Close an open position."""
+    engine = mod("src.trading.engine")
+    result = engine.close_position(position_id, instrument_id=instrument_id, reason=reason)
+    if result.success:
+        console.print(f"[green]{result.message}[/green]")
+    else:
+        console.print(f"[red]FAILED: {result.message}[/red]")
+
+
+@app.command("limit")
+def trade_limit(
+    direction: str = typer.Argument(..., help="BUY or SELL"),
+    symbol: str = typer.Argument(..., help="Instrument symbol"),
+    amount: float = typer.Argument(..., help="Amount in USD"),
+    price: float = typer.Option(..., help="Limit price"),
+    sl: float = SL_OPTION,
+    tp: float = TP_OPTION,
+    leverage: float = LEVERAGE_OPTION,
+    reason: str = REASON_OPTION,
+):
+    """Create a limit order."""
+    engine = mod("src.trading.engine")
+    result = engine.create_limit_order(symbol, amount, price, direction.upper(), sl, tp, leverage, reason)
+    if result.success:
+        console.print(f"[green]{result.message}[/green]")
+        if result.order_id:
+            console.print(f"  Order ID: {result.order_id}")
+    else:
+        console.print(f"[red]FAILED: {result.message}[/red]")
+
+
+@app.command("check")
+def trade_check(
+    symbol: str = typer.Argument(..., help="Instrument symbol"),
+    amount: float = typer.Argument(..., help="Amount in USD"),
+    direction: str = DIRECTION_OPTION,
+    leverage: float = LEVERAGE_OPTION,
+):
+    """Risk check without executing (dry run)."""
+    risk = mod("src.trading.risk")
+    result = risk.check_trade(symbol, amount, direction.upper(), leverage)
+
+    if result.passed:
+        console.print(f"[green]PASSED[/green]")
+    else:
+        console.print(f"[red]REJECTED[/red]")
+
+    if result.violations:
+        console.print("\n[red]Violations:[/red]")
+        for v in result.violations:
+            console.print(f"  - {v}")
+
+    if result.warnings:
+        console.print("\n[yellow]Warnings:[/yellow]")
+        for w in result.warnings:
+            console.print(f"  - {w}")
+
+
+@app.command("fees")
+def trade_fees(
+    symbol: str = typer.Argument(..., help="Instrument symbol"),
+    amount: float = typer.Argument(..., help="Amount in USD"),
+    direction: str = DIRECTION_OPTION,
+    leverage: float = LEVERAGE_OPTION,
+    format: str = FORMAT_OPTION,
+):
+    """Estimate trading fees for an instrument."""
+    fees = mod("src.trading.fees")
+
+    data = fees.estimate_trade_fees(symbol, amount, direction.upper(), leverage)
+    if "error" in data:
+        console.print(f"[red]{data['error']}[/red]")
+        raise typer.Exit(1)
+
+    if format == "json":
+        emit_json(data)
+        return
+
+    console.print(f"\n[bold]Fee Estimate: {data['symbol']}[/bold]")
+    console.print(f"  Amount:         ${data['amount']:,.2f}")
+    console.print(f"  Direction:      {data['direction']}")
+    console.print(f"  Leverage:       {data['leverage']}x")
+    console.print(f"  Asset Class:    {data['asset_class']}")
+    console.print(f"  Price:          ${data['price']:,.4f}" if data.get("price") else "  Price:          N/A")
+    console.print(f"  Spread:         {data['spread_pct']:.4f}%")
+
+    console.print(f"\n[bold]Costs[/bold]")
+    console.print(f"  Spread Cost:    ${data['spread_cost']:,.2f}")
+    if data["crypto_fee"] > 0:
+        console.print(f"  Crypto Fee:     ${data['crypto_fee']:,.2f}")
+    if data["overnight_daily"] > 0:
+        console.print(f"  Overnight/Day:  ${data['overnight_daily']:,.2f}")
+        console.print(f"  Overnight/Week: ${data['overnight_weekly']:,.2f}")
+        console.print(f"  Overnight/Mo:   ${data['overnight_monthly']:,.2f}")
+
+    console.print(f"\n[bold]Summary[/bold]")
+    console.print(f"  Entry Cost:     ${data['total_entry_cost']:,.2f}")
+    console.print(f"  1-Month Cost:   ${data['total_1month_cost']:,.2f}")
+    console.print(f"  Cost %:         {data['cost_pct']:.4f}%")
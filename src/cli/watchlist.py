@@ -0,0 +1,33 @@
+"""``watchlist`` command group."""
+from __future__ import annotations
+
+import typer
+
+from src.cli.common import console, mod
+from src.cli.groups import COMMAND_GROUPS
+
+app = typer.Typer(help=COMMAND_GROUPS["watchlist"])
+
+
+@app.callback(invoke_without_command=True)
+def watchlist_show(ctx: typer.Context):
+    if ctx.invoked_subcommand is not None:
+        return
+    manager = mod("src.portfolio.manager")
+    wls = manager.get_watchlists()
+    if not wls:
+        console.print("No watchlists found.")
+        return
+
+    for wl in wls:
+        name = wl.get("name", wl.get("Name", wl.get("WatchlistName", "Unnamed")))
+        items = wl.get("items", wl.get("Items", wl.get("InstrumentIDs", [])))
+        console.print(f"\n[bold]{name}[/bold] ({len(items)} items)")
+        for item in items[:20]:
+            if isinstance(item, dict):
+                sym = (item.get("market", {}).get("symbolName", "")
+                       or item.get("SymbolFull", "")
+                       or item.get("itemId", ""))
+                console.print(f"  - {sym}")
+            else:
+                console.print(f"  - ID: {item}")
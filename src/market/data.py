@@ -1,19 +1,33 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import copy
 import httpx
+import json
 import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
 
-import pandas as pd
+from pydantic import TypeAdapter
 
-from src.api.client import EtoroClient
+from src.api.client import HTTP2_AVAILABLE, POOL_LIMITS, EtoroClient
 from src.api import endpoints
 from src.api.models import InstrumentRate
-from src.market import indicators as ind
 from src.storage.repositories import InstrumentRepo
 
+if TYPE_CHECKING:
+    # numpy/pandas (and the indicators built on them) are imported inside the
+    # functions that need them, so rate/search/portfolio callers skip them.
+    import numpy as np
+    import pandas as pd
+
 
 # Standard tickers that resolve incorrectly on eToro's search API.
 # Single/double-letter symbols often match forex pairs or futures first.
@@ -27,22 +41,105 @@ SYMBOL_ALIASES: dict[str, str] = {
 
 _client: EtoroClient | None = None
 _vix_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+_repo: InstrumentRepo | None = None
+# Shared pool for overlapping blocking API calls; EtoroClient's rate limiter
+# still paces what actually goes out.
+_io_pool: ThreadPoolExecutor | None = None
+_IO_WORKERS = 8
+# Process-level LRU memo for resolve_symbol, keyed by upper-cased symbol.
+# Only hits are stored so a failed lookup is retried on the next call.
+_SYMBOL_CACHE_SIZE = 4096
+_symbol_cache: OrderedDict[str, dict] = OrderedDict()
+_symbol_cache_lock = threading.Lock()
+
+
+def _remember_symbols(items: Iterable[tuple[str, dict]]) -> None:
+    """Store ``(upper_symbol, info)`` pairs, evicting the least recently used."""
+    with _symbol_cache_lock:
+        for key, info in items:
+            _symbol_cache[key] = dict(info)
+            _symbol_cache.move_to_end(key)
+        while len(_symbol_cache) > _SYMBOL_CACHE_SIZE:
+            _symbol_cache.popitem(last=False)
+
+
+class _TTLCache:
+    """Thread-safe ``{key: (expiry, value)}`` store for short-lived fetch results."""
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        self._data: dict[Any, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(
+        self, key: Any, compute, keep=lambda value: True, ttl: float | None = None
+    ) -> Any:
+        """Return a fresh cached value for ``key`` or compute and store it.
+
+        ``keep`` decides whether a computed value is worth caching (failures
+        usually are not); ``ttl`` overrides the cache-wide lifetime.
+        """
+        now = time.monotonic()
+        with self._lock:
+            hit = self._data.get(key)
+        if hit is not None and hit[0] > now:
+            return hit[1]
+        value = compute()
+        if keep(value):
+            with self._lock:
+                self._data[key] = (now + (self._ttl if ttl is None else ttl), value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# SPY/QQQ daily analysis and VIX barely move within a few minutes; regime
+# checks made in quick succession reuse them.
+_REGIME_ANALYSIS_TTL = 300.0
+_VIX_TTL = 60.0
+_regime_cache = _TTLCache(_REGIME_ANALYSIS_TTL)
+_vix_cache = _TTLCache(_VIX_TTL)
 _log = logging.getLogger(__name__)
 
 
 def _get_client() -> EtoroClient:
     global _client
     if _client is None:
-        _client = EtoroClient()
+        with _client_lock:
+            if _client is None:
+                _client = EtoroClient()
     return _client
 
 
+def _get_io_pool() -> ThreadPoolExecutor:
+    global _io_pool
+    if _io_pool is None:
+        with _client_lock:
+            if _io_pool is None:
+                _io_pool = ThreadPoolExecutor(
+                    max_workers=_IO_WORKERS, thread_name_prefix="market-io"
+                )
+    return _io_pool
+
+
+def _get_repo() -> InstrumentRepo:
+    global _repo
+    if _repo is None:
+        _repo = InstrumentRepo()
+    return _repo
+
+
 def _get_vix_client() -> httpx.Client:
     global _vix_client
     if _vix_client is None:
         _vix_client = httpx.Client(
             timeout=8,
             headers={"User-Agent": "Mozilla/5.0"},
+            http2=HTTP2_AVAILABLE,
+            limits=POOL_LIMITS,
         )
     return _vix_client
 
@@ -55,50 +152,123 @@ def search_instrument(query: str) -> list[dict]:
     )
     items = data.get("items", [])
     results = []
-    repo = InstrumentRepo()
+    rows = []
     for item in items:
-        inst = {
-            "instrument_id": item.get("instrumentId") or item.get("internalInstrumentId"),
-            "symbol": item.get("internalSymbolFull", ""),
-            "name": item.get("internalInstrumentDisplayName", ""),
-            "type": item.get("internalAssetClassId", ""),
+        iid = item.get("instrumentId") or item.get("internalInstrumentId")
+        sym = item.get("internalSymbolFull", "")
+        name = item.get("internalInstrumentDisplayName", "")
+        typ = item.get("internalAssetClassId", "")
+        results.append({
+            "instrument_id": iid,
+            "symbol": sym,
+            "name": name,
+            "type": typ,
             "exchange": item.get("internalExchangeId", ""),
-        }
-        results.append(inst)
-        if inst["instrument_id"]:
-            repo.upsert(inst["instrument_id"], inst["symbol"], inst["name"], inst.get("type", ""))
+        })
+        if iid:
+            rows.append((iid, sym, name, typ))
+    if rows:
+        _get_repo().upsert_many(rows)
     return results
 
 
 def resolve_symbol(symbol: str) -> dict | None:
-    repo = InstrumentRepo()
+    key = symbol.upper()
+    with _symbol_cache_lock:
+        hit = _symbol_cache.get(key)
+        if hit is not None:
+            _symbol_cache.move_to_end(key)
+    if hit is not None:
+        return dict(hit)
+
+    info = _resolve_symbol_uncached(symbol)
+    if info is not None:
+        _remember_symbols([(key, info)])
+    return info
+
+
+def clear_caches() -> None:
+    """Drop memoized symbol resolutions and short-lived market results
+    (e.g. after editing the instruments table)."""
+    global _repo
+    _repo = None
+    with _symbol_cache_lock:
+        _symbol_cache.clear()
+    _regime_cache.clear()
+    _vix_cache.clear()
+    _candle_cache.clear()
+
+
+def _resolve_symbol_uncached(symbol: str) -> dict | None:
+    repo = _get_repo()
     cached = repo.get_by_symbol(symbol)
     if cached:
         return cached
 
     # Redirect ambiguous tickers to their correct eToro symbol
-    lookup = SYMBOL_ALIASES.get(symbol.upper(), symbol)
+    symbol_u = symbol.upper()
+    lookup = SYMBOL_ALIASES.get(symbol_u, symbol)
+    lookup_u = lookup.upper()
 
     results = search_instrument(lookup)
     for r in results:
-        if r["symbol"].upper() == lookup.upper():
+        if r["symbol"].upper() == lookup_u:
             # Cache under the original symbol too (e.g. V → V.RTH)
-            if lookup.upper() != symbol.upper():
-                repo.upsert(r["instrument_id"], symbol.upper(), r["name"], r.get("type", ""))
+            if lookup_u != symbol_u:
+                repo.upsert(r["instrument_id"], symbol_u, r["name"], r.get("type", ""))
             return r
 
     # No exact match — return None instead of blindly picking results[0]
     return None
 
 
+def resolve_symbols(symbols: list[str]) -> dict[str, dict]:
+    """Resolve several symbols at once, keyed by the symbol as given.
+
+    Cached instruments come from a single DB query; only misses fall back to
+    the per-symbol search in ``resolve_symbol``. Unresolvable symbols are
+    left out of the result.
+    """
+    with _symbol_cache_lock:
+        memo = {sym: dict(_symbol_cache[sym.upper()])
+                for sym in symbols if sym.upper() in _symbol_cache}
+    missing = [sym for sym in symbols if sym not in memo]
+    cached = _get_repo().get_by_symbols(missing) if missing else {}
+    if cached:
+        _remember_symbols(cached.items())
+    resolved = {}
+    for sym in symbols:
+        info = memo.get(sym) or cached.get(sym.upper()) or resolve_symbol(sym)
+        if info:
+            resolved[sym] = info
+    return resolved
+
+
+# The rates endpoint takes a comma-separated id list; keep requests bounded.
+_RATES_BATCH = 50
+# Validates a whole rates payload in one pydantic-core call.
+_RATES_ADAPTER = TypeAdapter(list[InstrumentRate])
+
+
+def _fetch_rates_chunk(chunk: list[int]) -> list[InstrumentRate]:
+    data = _get_client().get(
+        endpoints.INSTRUMENT_RATES, instrumentIds=",".join(str(i) for i in chunk)
+    )
+    rates_list = data.get("rates", data.get("Rates", []))
+    return _RATES_ADAPTER.validate_python(rates_list)
+
+
 def get_rates(instrument_ids: list[int]) -> list[InstrumentRate]:
-    client = _get_client()
+    chunks = [
+        instrument_ids[start:start + _RATES_BATCH]
+        for start in range(0, len(instrument_ids), _RATES_BATCH)
+    ]
+    if len(chunks) <= 1:
+        return _fetch_rates_chunk(chunks[0]) if chunks else []
+    # Several chunks: fetch them concurrently, keeping input order.
     results = []
-    for iid in instrument_ids:
-        data = client.get(endpoints.INSTRUMENT_RATES, instrumentIds=str(iid))
-        rates_list = data.get("rates", data.get("Rates", []))
-        for r in rates_list:
-            results.append(InstrumentRate.model_validate(r))
+    for rates in _get_io_pool().map(_fetch_rates_chunk, chunks):
+        results.extend(rates)
     return results
 
 
@@ -107,9 +277,50 @@ def get_rate(instrument_id: int) -> InstrumentRate | None:
     return rates[0] if rates else None
 
 
-def get_candles(
+_CANDLE_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+_CANDLE_KEYS = ("fromDate", "open", "high", "low", "close", "volume")
+_CANDLE_KEYS_LEGACY = ("FromDate", "Open", "High", "Low", "Close", "Volume")
+
+
+# How long a candle payload is reused, by interval: roughly how fast the
+# still-forming last bar moves enough to matter.
+_CANDLE_TTL = {
+    "OneMinute": 5.0,
+    "FiveMinutes": 15.0,
+    "FifteenMinutes": 30.0,
+    "ThirtyMinutes": 30.0,
+    "OneHour": 30.0,
+    "FourHours": 60.0,
+    "OneDay": 60.0,
+    "OneWeek": 300.0,
+}
+_candle_cache = _TTLCache(30.0)
+
+
+def get_candles_arrays(
     instrument_id: int, interval: str = "OneDay", count: int = 60
-) -> pd.DataFrame:
+) -> dict[str, np.ndarray]:
+    """Fetch candles as ``{column: ndarray}``, oldest first, without pandas frames.
+
+    ``timestamp`` is ``datetime64[ns]`` in UTC. Returns ``{}`` when the API
+    has no candles. Payloads are reused for a short, interval-dependent TTL,
+    so the arrays are shared and read-only.
+    """
+    arrays = _candle_cache.get_or_compute(
+        (instrument_id, interval, count),
+        lambda: _fetch_candle_arrays(instrument_id, interval, count),
+        keep=bool,
+        ttl=_CANDLE_TTL.get(interval),
+    )
+    return dict(arrays)
+
+
+def _fetch_candle_arrays(
+    instrument_id: int, interval: str, count: int
+) -> dict[str, np.ndarray]:
+    import numpy as np
+    import pandas as pd
+
     client = _get_client()
     path = endpoints.CANDLES.format(
         instrument_id=instrument_id, direction="desc", period=interval, count=count
@@ -123,24 +334,49 @@ def get_candles(
     else:
         candles_raw = outer
 
-    rows = []
-    for c in candles_raw:
-        rows.append({
-            "timestamp": c.get("fromDate", c.get("FromDate", "")),
-            "open": c.get("open", c.get("Open", 0)),
-            "high": c.get("high", c.get("High", 0)),
-            "low": c.get("low", c.get("Low", 0)),
-            "close": c.get("close", c.get("Close", 0)),
-            "volume": c.get("volume", c.get("Volume", 0)),
-        })
+    if not candles_raw:
+        return {}
+
+    # Key casing is consistent within a response — pick it once, then build
+    # each column in a single pass instead of a dict per candle.
+    keys = _CANDLE_KEYS if "open" in candles_raw[0] else _CANDLE_KEYS_LEGACY
+    ts_key, *ohlcv_keys = keys
+    timestamps = pd.to_datetime([c.get(ts_key, "") for c in candles_raw], utc=True)
+    columns = {"timestamp": timestamps.tz_localize(None).to_numpy()}
+    for name, key in zip(_CANDLE_COLUMNS[1:], ohlcv_keys):
+        columns[name] = np.array([c.get(key, 0) for c in candles_raw])
+
+    # The API returns newest first; reorder every column by timestamp at once.
+    order = np.argsort(columns["timestamp"], kind="stable")
+    sorted_columns = {name: col[order] for name, col in columns.items()}
+    for col in sorted_columns.values():
+        col.flags.writeable = False
+    return sorted_columns
+
+
+def get_candles(
+    instrument_id: int, interval: str = "OneDay", count: int = 60
+) -> pd.DataFrame:
+    import pandas as pd
 
-    df = pd.DataFrame(rows)
-    if not df.empty:
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
-        df = df.sort_values("timestamp").reset_index(drop=True)
+    arrays = get_candles_arrays(instrument_id, interval, count)
+    if not arrays:
+        return pd.DataFrame()
+    df = pd.DataFrame(arrays)  # copies, so callers may modify the frame
+    df["timestamp"] = df["timestamp"].dt.tz_localize("UTC")
     return df
 
 
+def get_candles_many(
+    instrument_ids: list[int], interval: str = "OneDay", count: int = 60
+) -> dict[int, pd.DataFrame]:
+    """``get_candles`` for several instruments, fetched concurrently."""
+    frames = _get_io_pool().map(
+        lambda iid: get_candles(iid, interval, count), instrument_ids
+    )
+    return dict(zip(instrument_ids, frames))
+
+
 INTERVAL_MAP = {
     "M1": "OneMinute",
     "M5": "FiveMinutes",
@@ -153,6 +389,11 @@ INTERVAL_MAP = {
 }
 
 
+def _last(series: pd.Series) -> float:
+    """Last element of ``series`` as a Python float, read from its numpy buffer."""
+    return float(series.to_numpy()[-1])
+
+
 def _build_chandelier_dict(
     chandelier_long: Any,
     chandelier_short: Any,
@@ -165,10 +406,12 @@ def _build_chandelier_dict(
     (float('nan') is not JSON-serialisable) and to signal that there is
     insufficient candle history for a reliable stop calculation.
     """
-    ch_long = chandelier_long.iloc[-1]
-    ch_short = chandelier_short.iloc[-1]
-    direction_val = st_direction.iloc[-1]
-    st_val = st_line.iloc[-1]
+    import pandas as pd
+
+    ch_long = _last(chandelier_long)
+    ch_short = _last(chandelier_short)
+    direction_val = _last(st_direction)
+    st_val = _last(st_line)
     if pd.isna(ch_long) or pd.isna(ch_short) or pd.isna(direction_val) or pd.isna(st_val):
         return None
     return {
@@ -179,15 +422,93 @@ def _build_chandelier_dict(
     }
 
 
+@dataclass
+class _SignalSet:
+    """Signal descriptions plus running bullish/bearish tallies.
+
+    Polarity is given at each ``add`` site rather than re-derived by scanning
+    the text for "bullish"/"bearish".
+    """
+
+    items: list[str] = field(default_factory=list)
+    bullish: int = 0
+    bearish: int = 0
+
+    def add(self, text: str, polarity: int = 0) -> None:
+        self.items.append(text)
+        if polarity > 0:
+            self.bullish += 1
+        elif polarity < 0:
+            self.bearish += 1
+
+    @property
+    def trend(self) -> str:
+        if self.bullish > self.bearish:
+            return "BULLISH"
+        if self.bearish > self.bullish:
+            return "BEARISH"
+        return "NEUTRAL"
+
+
 def analyze_instrument(symbol: str, extended: bool = False) -> dict:
     info = resolve_symbol(symbol)
     if not info:
         return {"error": f"Instrument '{symbol}' not found"}
 
     iid = info["instrument_id"]
-    rate = get_rate(iid)
+    # The live quote and the candle history are independent requests.
+    rate_future = _get_io_pool().submit(get_rate, iid)
     df = get_candles(iid, "OneDay", 220)
+    return _analyze_candles(symbol, info, rate_future.result(), df, extended)
+
+
+def analyze_many(
+    symbols: list[str],
+    extended: bool = False,
+    on_done: Callable[[str], None] | None = None,
+) -> list[dict]:
+    """``analyze_instrument`` for a batch, results in input order.
+
+    Symbols are resolved together and every live quote comes from one
+    ``get_rates`` call; only the candle downloads (and the indicator math)
+    run per symbol, concurrently. ``on_done(symbol)`` fires as each finishes.
+    """
+    if not symbols:
+        return []
+    infos = resolve_symbols(symbols)
+    ids = list(dict.fromkeys(infos[sym]["instrument_id"] for sym in symbols if sym in infos))
+    rates = {rate.instrument_id: rate for rate in get_rates(ids)} if ids else {}
+
+    def one(symbol: str) -> dict:
+        info = infos.get(symbol)
+        if not info:
+            return {"error": f"Instrument '{symbol}' not found"}
+        iid = info["instrument_id"]
+        df = get_candles(iid, "OneDay", 220)
+        return _analyze_candles(symbol, info, rates.get(iid), df, extended)
+
+    results: list[dict] = [{}] * len(symbols)
+    pool = _get_io_pool()
+    futures = {pool.submit(one, sym): i for i, sym in enumerate(symbols)}
+    for fut in as_completed(futures):
+        i = futures[fut]
+        results[i] = fut.result()
+        if on_done is not None:
+            on_done(symbols[i])
+    return results
 
+
+def _analyze_candles(
+    symbol: str,
+    info: dict,
+    rate: InstrumentRate | None,
+    df: pd.DataFrame,
+    extended: bool,
+) -> dict:
+    import pandas as pd
+    from src.market import indicators as ind
+
+    iid = info["instrument_id"]
     if df.empty:
         return {
             "symbol": symbol,
@@ -197,23 +518,31 @@ def analyze_instrument(symbol: str, extended: bool = False) -> dict:
         }
 
     close = df["close"]
-    current_price = rate.mid if rate else close.iloc[-1]
-
-    rsi_val = ind.rsi(close).iloc[-1]
-    macd_line, signal_line, histogram = ind.macd(close)
-    bb_upper, bb_middle, bb_lower = ind.bollinger_bands(close)
-    atr_val = ind.atr(df).iloc[-1]
-    chandelier_long, chandelier_short = ind.chandelier_exit(df)
-    st_line, st_direction = ind.supertrend(df)
-    sma_20 = ind.sma(close, 20).iloc[-1]
-    sma_50 = ind.sma(close, 50).iloc[-1]
-    ema_12 = ind.ema(close, 12).iloc[-1]
-    ema_26 = ind.ema(close, 26).iloc[-1]
+    last_close = _last(close)
+    current_price = rate.mid if rate else last_close
+
+    ctx = ind.TechnicalContext.from_close(close)
+    rsi_val = _last(ind.rsi(close))
+    macd_line, signal_line, histogram = ctx.macd()
+    bb_upper, bb_middle, bb_lower = ctx.bollinger_bands()
+    bb_upper_val, bb_middle_val, bb_lower_val = _last(bb_upper), _last(bb_middle), _last(bb_lower)
+    # One true-range pass feeds every ATR period below.
+    tr = ind.true_range(df)
+    atr_14 = ind.atr(df, tr=tr)
+    atr_val = _last(atr_14)
+    chandelier_long, chandelier_short = ind.chandelier_exit(
+        df, atr_series=ind.atr(df, 22, tr=tr)
+    )
+    st_line, st_direction = ind.supertrend(df, atr_series=atr_14)
+    sma_20 = _last(ctx.sma_20)
+    sma_50 = _last(ctx.sma_50)
+    ema_12 = _last(ctx.ema_12)
+    ema_26 = _last(ctx.ema_26)
 
     # Swing-trading MAs
-    ema_8 = ind.ema(close, 8).iloc[-1]
-    ema_21 = ind.ema(close, 21).iloc[-1]
-    sma_200_val = ind.sma(close, 200).iloc[-1] if len(close) >= 200 else float("nan")
+    ema_8 = _last(ctx.ema_8)
+    ema_21 = _last(ctx.ema_21)
+    sma_200_val = _last(ctx.sma_200) if ctx.sma_200 is not None else float("nan")
 
     # Relative volume
     rvol_val = ind.rvol(df) if "volume" in df.columns else float("nan")
@@ -222,59 +551,50 @@ def analyze_instrument(symbol: str, extended: bool = False) -> dict:
     alignment = ind.ma_alignment(current_price, ema_21, sma_50, sma_200_val)
 
     # Pre-market gap: current live price vs last candle close
-    last_close = close.iloc[-1]
     gap_pct = round((current_price - last_close) / last_close * 100, 2) if last_close else None
 
     # Determine trend
-    signals = []
+    signals = _SignalSet()
     if rsi_val < 30:
-        signals.append("RSI oversold (bullish)")
+        signals.add("RSI oversold (bullish)", +1)
     elif rsi_val > 70:
-        signals.append("RSI overbought (bearish)")
+        signals.add("RSI overbought (bearish)", -1)
 
-    if histogram.iloc[-1] > 0 and histogram.iloc[-2] <= 0:
-        signals.append("MACD bullish crossover")
-    elif histogram.iloc[-1] < 0 and histogram.iloc[-2] >= 0:
-        signals.append("MACD bearish crossover")
+    hist_prev, hist_last = histogram.to_numpy()[-2:].tolist()
+    if hist_last > 0 and hist_prev <= 0:
+        signals.add("MACD bullish crossover", +1)
+    elif hist_last < 0 and hist_prev >= 0:
+        signals.add("MACD bearish crossover", -1)
 
-    if current_price < bb_lower.iloc[-1]:
-        signals.append("Price below lower BB (oversold)")
-    elif current_price > bb_upper.iloc[-1]:
-        signals.append("Price above upper BB (overbought)")
+    if current_price < bb_lower_val:
+        signals.add("Price below lower BB (oversold)")
+    elif current_price > bb_upper_val:
+        signals.add("Price above upper BB (overbought)")
 
     if sma_20 > sma_50:
-        signals.append("SMA20 > SMA50 (bullish)")
+        signals.add("SMA20 > SMA50 (bullish)", +1)
     else:
-        signals.append("SMA20 < SMA50 (bearish)")
+        signals.add("SMA20 < SMA50 (bearish)", -1)
 
     # MA alignment signals
     if alignment["status"] == "GOLDEN":
-        signals.append("Golden MA alignment (bullish)")
+        signals.add("Golden MA alignment (bullish)", +1)
     elif alignment["status"] == "DEATH":
-        signals.append("Death MA alignment (bearish)")
+        signals.add("Death MA alignment (bearish)", -1)
 
     # RVOL signals
     if not pd.isna(rvol_val):
         if rvol_val >= 2.0:
-            signals.append(f"RVOL {rvol_val:.1f}x very high volume")
+            signals.add(f"RVOL {rvol_val:.1f}x very high volume")
         elif rvol_val >= 1.5:
-            signals.append(f"RVOL {rvol_val:.1f}x above average volume")
+            signals.add(f"RVOL {rvol_val:.1f}x above average volume")
         elif rvol_val < 0.5:
-            signals.append(f"RVOL {rvol_val:.1f}x low volume (weak conviction)")
+            signals.add(f"RVOL {rvol_val:.1f}x low volume (weak conviction)")
 
     # Gap signals
     if gap_pct is not None and abs(gap_pct) >= 1.0:
         direction = "up" if gap_pct > 0 else "down"
-        signals.append(f"Gap {direction} {abs(gap_pct):.1f}%")
-
-    bullish = sum(1 for s in signals if "bullish" in s.lower())
-    bearish = sum(1 for s in signals if "bearish" in s.lower())
-    if bullish > bearish:
-        trend = "BULLISH"
-    elif bearish > bullish:
-        trend = "BEARISH"
-    else:
-        trend = "NEUTRAL"
+        signals.add(f"Gap {direction} {abs(gap_pct):.1f}%")
 
     result = {
         "symbol": symbol,
@@ -284,14 +604,14 @@ def analyze_instrument(symbol: str, extended: bool = False) -> dict:
         "spread_pct": round(rate.spread_pct, 4) if rate else None,
         "rsi": round(rsi_val, 2),
         "macd": {
-            "line": round(macd_line.iloc[-1], 4),
-            "signal": round(signal_line.iloc[-1], 4),
-            "histogram": round(histogram.iloc[-1], 4),
+            "line": round(_last(macd_line), 4),
+            "signal": round(_last(signal_line), 4),
+            "histogram": round(hist_last, 4),
         },
         "bollinger": {
-            "upper": round(bb_upper.iloc[-1], 4),
-            "middle": round(bb_middle.iloc[-1], 4),
-            "lower": round(bb_lower.iloc[-1], 4),
+            "upper": round(bb_upper_val, 4),
+            "middle": round(bb_middle_val, 4),
+            "lower": round(bb_lower_val, 4),
         },
         "sma_20": round(sma_20, 4),
         "sma_50": round(sma_50, 4),
@@ -307,51 +627,44 @@ def analyze_instrument(symbol: str, extended: bool = False) -> dict:
         "chandelier": _build_chandelier_dict(
             chandelier_long, chandelier_short, st_direction, st_line
         ),
-        "trend": trend,
-        "signals": signals,
+        "trend": signals.trend,
+        "signals": signals.items,
     }
 
     if extended:
         stoch_k, stoch_d = ind.stochastic(df)
-        adx_val = ind.adx(df)
+        adx_val = ind.adx(df, atr_series=atr_14)
         obv_series = ind.obv(df)
         sr = ind.support_resistance(df)
         fib = ind.fibonacci_retracement(
             float(df["high"].max()), float(df["low"].min())
         )
 
-        stoch_k_val = stoch_k.iloc[-1]
-        stoch_d_val = stoch_d.iloc[-1]
-        adx_last = adx_val.iloc[-1]
+        stoch_k_val = _last(stoch_k)
+        stoch_d_val = _last(stoch_d)
+        adx_last = _last(adx_val)
 
         result["stochastic"] = {
             "k": round(stoch_k_val, 2),
             "d": round(stoch_d_val, 2),
         }
         result["adx"] = round(adx_last, 2)
-        result["obv"] = round(obv_series.iloc[-1], 0)
+        result["obv"] = round(_last(obv_series), 0)
         result["support_resistance"] = sr
         result["fibonacci"] = fib
 
         if stoch_k_val < 20:
-            signals.append("Stochastic oversold (bullish)")
+            signals.add("Stochastic oversold (bullish)", +1)
         elif stoch_k_val > 80:
-            signals.append("Stochastic overbought (bearish)")
+            signals.add("Stochastic overbought (bearish)", -1)
 
         if adx_last > 25:
-            signals.append(f"ADX {adx_last:.0f} strong trend")
+            signals.add(f"ADX {adx_last:.0f} strong trend")
         else:
-            signals.append(f"ADX {adx_last:.0f} weak trend")
+            signals.add(f"ADX {adx_last:.0f} weak trend")
 
         # Recompute trend with new signals
-        bullish = sum(1 for s in signals if "bullish" in s.lower())
-        bearish = sum(1 for s in signals if "bearish" in s.lower())
-        if bullish > bearish:
-            result["trend"] = "BULLISH"
-        elif bearish > bullish:
-            result["trend"] = "BEARISH"
-        else:
-            result["trend"] = "NEUTRAL"
+        result["trend"] = signals.trend
 
     return result
 
@@ -421,6 +734,50 @@ def _fetch_vix_external() -> float | None:
     return None
 
 
+def _regime_analysis(symbol: str) -> dict:
+    # Deep copy: the regime output embeds nested values (e.g. ma_alignment),
+    # and a caller mutating them must not change the cached analysis.
+    return copy.deepcopy(_regime_cache.get_or_compute(
+        ("analysis", symbol, True, "OneDay", 220),
+        lambda: analyze_instrument(symbol, extended=True),
+        keep=lambda result: "error" not in result,
+    ))
+
+
+def _regime_vix() -> float | None:
+    return _vix_cache.get_or_compute(
+        "VIX", _fetch_vix_cached, keep=lambda value: value is not None
+    )
+
+
+def _vix_cache_path() -> Path:
+    from config import get_settings
+    return Path(get_settings().db_path).with_name("vix_cache.json")
+
+
+def _fetch_vix_cached() -> float | None:
+    """``_fetch_vix_external`` behind a small JSON file shared across CLI runs.
+
+    A value younger than ``_VIX_TTL`` is returned without touching the
+    network (or creating the VIX HTTP client).
+    """
+    path = _vix_cache_path()
+    try:
+        entry = json.loads(path.read_text())
+        if time.time() - entry["ts"] < _VIX_TTL:
+            return float(entry["value"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    value = _fetch_vix_external()
+    if value is not None:
+        try:
+            path.write_text(json.dumps({"ts": time.time(), "value": value}))
+        except OSError:
+            _log.debug("Could not write VIX cache %s", path, exc_info=True)
+    return value
+
+
 def analyze_market_regime() -> dict[str, Any]:
     """Analyze broad market regime: SPY + QQQ trend, VIX level.
 
@@ -429,8 +786,15 @@ def analyze_market_regime() -> dict[str, Any]:
     """
     regime: dict[str, Any] = {"errors": []}
 
+    # The three lookups are independent and I/O-bound — run them together.
+    # VIX goes through its own client, so it does not contend for the eToro limiter.
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        spy_future = ex.submit(_regime_analysis, "SPY")
+        qqq_future = ex.submit(_regime_analysis, "QQQ")
+        vix_future = ex.submit(_regime_vix)
+    spy, qqq, vix_val = spy_future.result(), qqq_future.result(), vix_future.result()
+
     # SPY analysis
-    spy = analyze_instrument("SPY", extended=True)
     if "error" not in spy:
         regime["spy"] = {
             "price": spy["price"],
@@ -447,7 +811,6 @@ def analyze_market_regime() -> dict[str, Any]:
         regime["errors"].append(f"SPY: {spy['error']}")
 
     # QQQ analysis
-    qqq = analyze_instrument("QQQ", extended=True)
     if "error" not in qqq:
         regime["qqq"] = {
             "price": qqq["price"],
@@ -462,7 +825,6 @@ def analyze_market_regime() -> dict[str, Any]:
         regime["errors"].append(f"QQQ: {qqq['error']}")
 
     # VIX analysis — fetched from external sources (VIX is not on eToro)
-    vix_val = _fetch_vix_external()
     if vix_val is not None:
         if vix_val < 13:
             vix_regime = "VERY_LOW"
@@ -1,11 +1,51 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _rolling_mean_std(
+    series: pd.Series, period: int, with_std: bool = True
+) -> tuple[pd.Series, pd.Series | None]:
+    """Rolling mean (and sample std) over a strided window view of the values.
+
+    Matches ``series.rolling(period).mean()/.std()``: the first
+    ``period - 1`` values are NaN and any NaN inside a window propagates.
+    """
+    values = series.to_numpy(dtype=float)
+    mean = np.full(len(values), np.nan)
+    if 0 < period <= len(values):
+        mean[period - 1:] = sliding_window_view(values, period).mean(axis=1)
+    mean_s = pd.Series(mean, index=series.index, name=series.name)
+    return mean_s, _rolling_std(series, period) if with_std else None
+
+
+def _rolling_std(series: pd.Series, period: int) -> pd.Series:
+    """Rolling sample std, matching ``series.rolling(period).std()``."""
+    values = series.to_numpy(dtype=float)
+    std = np.full(len(values), np.nan)
+    if 0 < period <= len(values):
+        std[period - 1:] = sliding_window_view(values, period).std(axis=1, ddof=1)
+    return pd.Series(std, index=series.index, name=series.name)
+
+
+def _rolling_extreme(series: pd.Series, period: int, reduce) -> pd.Series:
+    """Trailing ``period``-bar max/min (``reduce`` is ``np.max``/``np.min``).
+
+    Matches ``series.rolling(period).max()/.min()``, NaN warm-up included.
+    """
+    values = series.to_numpy(dtype=float)
+    out = np.full(len(values), np.nan)
+    if 0 < period <= len(values):
+        out[period - 1:] = reduce(sliding_window_view(values, period), axis=1)
+    return pd.Series(out, index=series.index, name=series.name)
 
 
 def sma(series: pd.Series, period: int) -> pd.Series:
-    return series.rolling(window=period).mean()
+    return _rolling_mean_std(series, period, with_std=False)[0]
 
 
 def ema(series: pd.Series, period: int) -> pd.Series:
@@ -27,9 +67,18 @@ def macd(
     fast: int = 12,
     slow: int = 26,
     signal: int = 9,
+    ema_fast: pd.Series | None = None,
+    ema_slow: pd.Series | None = None,
 ) -> tuple[pd.Series, pd.Series, pd.Series]:
-    ema_fast = ema(series, fast)
-    ema_slow = ema(series, slow)
+    """MACD line, signal and histogram.
+
+    ``ema_fast``/``ema_slow`` may be passed in when the caller already holds
+    those EMAs (see ``TechnicalContext``), skipping two full passes.
+    """
+    if ema_fast is None:
+        ema_fast = ema(series, fast)
+    if ema_slow is None:
+        ema_slow = ema(series, slow)
     macd_line = ema_fast - ema_slow
     signal_line = ema(macd_line, signal)
     histogram = macd_line - signal_line
@@ -37,52 +86,103 @@ def macd(
 
 
 def bollinger_bands(
-    series: pd.Series, period: int = 20, std_dev: float = 2.0
+    series: pd.Series,
+    period: int = 20,
+    std_dev: float = 2.0,
+    middle: pd.Series | None = None,
 ) -> tuple[pd.Series, pd.Series, pd.Series]:
-    middle = sma(series, period)
-    std = series.rolling(window=period).std()
+    if middle is None:
+        middle, std = _rolling_mean_std(series, period)
+    else:
+        std = _rolling_std(series, period)
     upper = middle + std_dev * std
     lower = middle - std_dev * std
     return upper, middle, lower
 
 
-def atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
-    high = df["high"]
-    low = df["low"]
-    close = df["close"]
-    tr1 = high - low
-    tr2 = (high - close.shift()).abs()
-    tr3 = (low - close.shift()).abs()
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+@dataclass
+class TechnicalContext:
+    """Moving averages of one close series, computed once and shared.
+
+    ``analyze_instrument`` reads these directly and feeds them to ``macd``
+    (EMA 12/26) and ``bollinger_bands`` (SMA 20) instead of letting each
+    indicator recompute them. ``sma_200`` is None with under 200 bars.
+    """
+
+    close: pd.Series
+    sma_20: pd.Series
+    sma_50: pd.Series
+    sma_200: pd.Series | None
+    ema_8: pd.Series
+    ema_12: pd.Series
+    ema_21: pd.Series
+    ema_26: pd.Series
+
+    @classmethod
+    def from_close(cls, close: pd.Series) -> TechnicalContext:
+        return cls(
+            close=close,
+            sma_20=sma(close, 20),
+            sma_50=sma(close, 50),
+            sma_200=sma(close, 200) if len(close) >= 200 else None,
+            ema_8=ema(close, 8),
+            ema_12=ema(close, 12),
+            ema_21=ema(close, 21),
+            ema_26=ema(close, 26),
+        )
+
+    def macd(self, signal: int = 9) -> tuple[pd.Series, pd.Series, pd.Series]:
+        return macd(self.close, signal=signal, ema_fast=self.ema_12, ema_slow=self.ema_26)
+
+    def bollinger_bands(self, std_dev: float = 2.0) -> tuple[pd.Series, pd.Series, pd.Series]:
+        return bollinger_bands(self.close, 20, std_dev, middle=self.sma_20)
+
+
+def true_range(df: pd.DataFrame) -> pd.Series:
+    """True range per bar; the first bar (no previous close) is high - low."""
+    high = df["high"].to_numpy(dtype=float)
+    low = df["low"].to_numpy(dtype=float)
+    close = df["close"].to_numpy(dtype=float)
+    tr = high - low
+    if len(tr) > 1:
+        prev_close = close[:-1]
+        # fmax skips NaN operands, like DataFrame.max(axis=1) did.
+        tr[1:] = np.fmax(
+            tr[1:], np.fmax(np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close))
+        )
+    return pd.Series(tr, index=df.index)
+
+
+def atr(df: pd.DataFrame, period: int = 14, tr: pd.Series | None = None) -> pd.Series:
+    """Wilder ATR; pass ``tr`` (from ``true_range``) to share it across periods."""
+    if tr is None:
+        tr = true_range(df)
     return tr.ewm(alpha=1 / period, min_periods=period).mean()
 
 
 def stochastic(
     df: pd.DataFrame, k_period: int = 14, d_period: int = 3
 ) -> tuple[pd.Series, pd.Series]:
-    low_min = df["low"].rolling(window=k_period).min()
-    high_max = df["high"].rolling(window=k_period).max()
+    low_min = _rolling_extreme(df["low"], k_period, np.min)
+    high_max = _rolling_extreme(df["high"], k_period, np.max)
     k = 100 * (df["close"] - low_min) / (high_max - low_min)
-    d = k.rolling(window=d_period).mean()
+    d = sma(k, d_period)
     return k, d
 
 
-def adx(df: pd.DataFrame, period: int = 14) -> pd.Series:
+def adx(
+    df: pd.DataFrame, period: int = 14, atr_series: pd.Series | None = None
+) -> pd.Series:
+    """ADX; ``atr_series`` may be a precomputed ``atr(df, period)``."""
     high = df["high"]
     low = df["low"]
-    close = df["close"]
 
     plus_dm = high.diff()
     minus_dm = -low.diff()
     plus_dm = plus_dm.where((plus_dm > minus_dm) & (plus_dm > 0), 0.0)
     minus_dm = minus_dm.where((minus_dm > plus_dm) & (minus_dm > 0), 0.0)
 
-    tr1 = high - low
-    tr2 = (high - close.shift()).abs()
-    tr3 = (low - close.shift()).abs()
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-    atr_vals = tr.ewm(alpha=1 / period, min_periods=period).mean()
+    atr_vals = atr(df, period) if atr_series is None else atr_series
     plus_di = 100 * plus_dm.ewm(alpha=1 / period, min_periods=period).mean() / atr_vals
     minus_di = 100 * minus_dm.ewm(alpha=1 / period, min_periods=period).mean() / atr_vals
 
@@ -91,11 +191,23 @@ def adx(df: pd.DataFrame, period: int = 14) -> pd.Series:
 
 
 def obv(df: pd.DataFrame) -> pd.Series:
-    direction = np.sign(df["close"].diff()).fillna(0)
-    return (direction * df["volume"]).cumsum()
+    close = df["close"].to_numpy(dtype=float)
+    flow = np.zeros(len(close))
+    np.subtract(close[1:], close[:-1], out=flow[1:])
+    np.sign(flow, out=flow)
+    flow[np.isnan(flow)] = 0.0  # a missing close counts as no change
+    flow *= df["volume"].to_numpy(dtype=float)
+    # Like Series.cumsum: a missing volume is skipped and stays NaN in place.
+    missing = np.isnan(flow)
+    flow[missing] = 0.0
+    np.cumsum(flow, out=flow)
+    flow[missing] = np.nan
+    return pd.Series(flow, index=df.index)
 
 
 def _dedupe_levels(levels: list[float], tolerance: float = 0.02) -> list[float]:
+    # Greedy: each level is compared with the last one *kept*, not its
+    # neighbour, so a chain of close levels collapses to its first member.
     if not levels:
         return levels
     sorted_levels = sorted(levels)
@@ -106,17 +218,25 @@ def _dedupe_levels(levels: list[float], tolerance: float = 0.02) -> list[float]:
     return deduped
 
 
+def _window_extremes(values: np.ndarray, window: int, reduce) -> np.ndarray:
+    """Distinct, sorted max/min of every full ``window``-bar span of ``values``.
+
+    Same set of levels a centred ``rolling(window).max()/min()`` yields once
+    NaNs are dropped; only which bar each value is labelled at differs.
+    """
+    if not 0 < window <= len(values):
+        return np.empty(0)
+    extremes = reduce(sliding_window_view(values, window), axis=1)
+    return np.unique(extremes[~np.isnan(extremes)])
+
+
 def support_resistance(df: pd.DataFrame, window: int = 20) -> dict:
-    highs = df["high"].rolling(window=window, center=True).max()
-    lows = df["low"].rolling(window=window, center=True).min()
-    current = df["close"].iloc[-1]
+    highs = _window_extremes(df["high"].to_numpy(dtype=float), window, np.max)
+    lows = _window_extremes(df["low"].to_numpy(dtype=float), window, np.min)
+    current = float(df["close"].to_numpy()[-1])
 
-    resistance_levels = _dedupe_levels(
-        sorted(set(highs.dropna().unique()))[-5:]
-    )
-    support_levels = _dedupe_levels(
-        sorted(set(lows.dropna().unique()))[:5]
-    )
+    resistance_levels = _dedupe_levels(highs[-5:].tolist())
+    support_levels = _dedupe_levels(lows[:5].tolist())
 
     nearest_support = max((s for s in support_levels if s < current), default=None)
     nearest_resistance = min((r for r in resistance_levels if r > current), default=None)
@@ -133,6 +253,7 @@ def chandelier_exit(
     df: pd.DataFrame,
     n: int = 22,
     mult: float = 3.0,
+    atr_series: pd.Series | None = None,
 ) -> tuple[pd.Series, pd.Series]:
     """Chandelier Exit trailing stop levels.
 
@@ -145,22 +266,72 @@ def chandelier_exit(
         df: OHLCV DataFrame with columns high, low, close.
         n: Lookback period (22 for equities/ETFs, 14 for crypto).
         mult: ATR multiplier for stop distance (3.0 standard).
+        atr_series: Precomputed ``atr(df, n)``, when the caller already has it.
 
     Returns:
         (long_stop, short_stop) — Series aligned to df.index.
         long_stop  = Highest_High(n) - mult × ATR(n)
         short_stop = Lowest_Low(n)  + mult × ATR(n)
     """
-    atr_series = atr(df, n)
-    long_stop = df["high"].rolling(n).max() - mult * atr_series
-    short_stop = df["low"].rolling(n).min() + mult * atr_series
+    if atr_series is None:
+        atr_series = atr(df, n)
+    long_stop = _rolling_extreme(df["high"], n, np.max) - mult * atr_series
+    short_stop = _rolling_extreme(df["low"], n, np.min) + mult * atr_series
     return long_stop, short_stop
 
 
+def _supertrend_bands(
+    ub_basic: np.ndarray, lb_basic: np.ndarray, close: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Band-locking recurrence behind ``supertrend``.
+
+    The loop is inherently sequential, so it runs over plain Python lists:
+    element access on lists avoids boxing a numpy scalar on every read, and
+    ``x != x`` is the cheapest NaN test.
+    """
+    ub = ub_basic.tolist()
+    lb = lb_basic.tolist()
+    close_l = close.tolist()
+    trend = [1] * len(ub)  # 1 = bullish, -1 = bearish
+
+    for i in range(1, len(ub)):
+        cur_ub = ub[i]
+        cur_lb = lb[i]
+        if cur_ub != cur_ub or cur_lb != cur_lb:
+            trend[i] = trend[i - 1]
+            continue
+        prev_close = close_l[i - 1]
+
+        # Band-locking: upper band only decreases (tightens) unless prior
+        # close broke above it, which resets the band to basic value.
+        prev_ub = ub[i - 1]
+        if prev_ub != prev_ub:
+            prev_ub = cur_ub
+        if not (cur_ub < prev_ub or prev_close > prev_ub):
+            cur_ub = ub[i] = prev_ub
+
+        # Band-locking: lower band only increases (tightens) unless prior
+        # close broke below it.
+        prev_lb = lb[i - 1]
+        if prev_lb != prev_lb:
+            prev_lb = cur_lb
+        if not (cur_lb > prev_lb or prev_close < prev_lb):
+            cur_lb = lb[i] = prev_lb
+
+        # Trend direction: flip only when price crosses the active band.
+        if trend[i - 1] == -1:
+            trend[i] = 1 if close_l[i] > cur_ub else -1
+        else:
+            trend[i] = -1 if close_l[i] < cur_lb else 1
+
+    return np.array(ub), np.array(lb), np.array(trend, dtype=np.int8)
+
+
 def supertrend(
     df: pd.DataFrame,
     n: int = 14,
     mult: float = 3.0,
+    atr_series: pd.Series | None = None,
 ) -> tuple[pd.Series, pd.Series]:
     """SuperTrend indicator — ATR-based trend filter with band-locking logic.
 
@@ -173,42 +344,20 @@ def supertrend(
         df: OHLCV DataFrame with columns high, low, close.
         n: ATR period.
         mult: ATR multiplier for band distance.
+        atr_series: Precomputed ``atr(df, n)``, when the caller already has it.
 
     Returns:
         (supertrend_line, direction) where direction is +1 (bullish) or -1 (bearish).
     """
     hl2 = (df["high"] + df["low"]) / 2
-    atr_series = atr(df, n)
+    if atr_series is None:
+        atr_series = atr(df, n)
 
-    ub_basic = (hl2 + mult * atr_series).to_numpy(dtype=float)
-    lb_basic = (hl2 - mult * atr_series).to_numpy(dtype=float)
-    close_arr = df["close"].to_numpy(dtype=float)
-    n_bars = len(df)
-
-    ub_arr = ub_basic.copy()
-    lb_arr = lb_basic.copy()
-    trend_arr = np.ones(n_bars, dtype=np.int8)  # 1 = bullish, -1 = bearish
-
-    for i in range(1, n_bars):
-        if np.isnan(ub_arr[i]) or np.isnan(lb_arr[i]):
-            trend_arr[i] = trend_arr[i - 1]
-            continue
-
-        # Band-locking: upper band only decreases (tightens) unless prior
-        # close broke above it, which resets the band to basic value.
-        prev_ub = ub_arr[i - 1] if not np.isnan(ub_arr[i - 1]) else ub_arr[i]
-        ub_arr[i] = ub_arr[i] if (ub_arr[i] < prev_ub or close_arr[i - 1] > prev_ub) else prev_ub
-
-        # Band-locking: lower band only increases (tightens) unless prior
-        # close broke below it.
-        prev_lb = lb_arr[i - 1] if not np.isnan(lb_arr[i - 1]) else lb_arr[i]
-        lb_arr[i] = lb_arr[i] if (lb_arr[i] > prev_lb or close_arr[i - 1] < prev_lb) else prev_lb
-
-        # Trend direction: flip only when price crosses the active band.
-        if trend_arr[i - 1] == -1:
-            trend_arr[i] = 1 if close_arr[i] > ub_arr[i] else -1
-        else:
-            trend_arr[i] = -1 if close_arr[i] < lb_arr[i] else 1
+    ub_arr, lb_arr, trend_arr = _supertrend_bands(
+        (hl2 + mult * atr_series).to_numpy(dtype=float),
+        (hl2 - mult * atr_series).to_numpy(dtype=float),
+        df["close"].to_numpy(dtype=float),
+    )
 
     # SuperTrend line: lower band when bullish, upper band when bearish.
     st_arr = np.where(trend_arr == 1, lb_arr, ub_arr)
@@ -1,12 +1,14 @@
 """News aggregation from Finnhub, Marketaux, and FMP APIs."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Any, Callable
 
 import httpx
 
 from config import settings
+from src.api.client import HTTP2_AVAILABLE, POOL_LIMITS, json_loads
 
 
 # Lazy singleton clients
@@ -24,6 +26,8 @@ def _get_finnhub() -> httpx.Client | None:
             base_url="https://finnhub.io/api/v1",
             params={"token": settings.finnhub_api_key},
             timeout=15.0,
+            http2=HTTP2_AVAILABLE,
+            limits=POOL_LIMITS,
         )
     return _finnhub
 
@@ -37,6 +41,8 @@ def _get_marketaux() -> httpx.Client | None:
             base_url="https://api.marketaux.com/v1",
             params={"api_token": settings.marketaux_api_key},
             timeout=15.0,
+            http2=HTTP2_AVAILABLE,
+            limits=POOL_LIMITS,
         )
     return _marketaux
 
@@ -50,6 +56,8 @@ def _get_fmp() -> httpx.Client | None:
             base_url="https://financialmodelingprep.com/api/v3",
             params={"apikey": settings.fmp_api_key},
             timeout=15.0,
+            http2=HTTP2_AVAILABLE,
+            limits=POOL_LIMITS,
         )
     return _fmp
 
@@ -64,14 +72,15 @@ def get_company_news(symbol: str, days: int = 7) -> dict[str, Any]:
         return {"error": "FINNHUB_API_KEY not configured"}
 
     try:
-        to_date = datetime.now().strftime("%Y-%m-%d")
-        from_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+        today = date.today()
+        to_date = today.isoformat()
+        from_date = (today - timedelta(days=days)).isoformat()
         resp = client.get(
             "/company-news",
             params={"symbol": symbol, "from": from_date, "to": to_date},
         )
         resp.raise_for_status()
-        articles = resp.json()
+        articles = json_loads(resp.content)
         return {
             "symbol": symbol,
             "count": len(articles),
@@ -102,7 +111,7 @@ def get_news_sentiment(symbol: str) -> dict[str, Any]:
     try:
         resp = client.get("/news-sentiment", params={"symbol": symbol})
         resp.raise_for_status()
-        data = resp.json()
+        data = json_loads(resp.content)
         buzz = data.get("buzz", {})
         sentiment = data.get("sentiment", {})
         return {
@@ -129,7 +138,7 @@ def get_market_news(limit: int = 20) -> dict[str, Any]:
     try:
         resp = client.get("/news", params={"category": "general"})
         resp.raise_for_status()
-        articles = resp.json()
+        articles = json_loads(resp.content)
         return {
             "count": min(len(articles), limit),
             "articles": [
@@ -162,7 +171,7 @@ def get_analyst_grades(symbol: str, limit: int = 10) -> dict[str, Any]:
     try:
         resp = client.get(f"/upgrades-downgrades", params={"symbol": symbol})
         resp.raise_for_status()
-        grades = resp.json()
+        grades = json_loads(resp.content)
         return {
             "symbol": symbol,
             "count": min(len(grades), limit),
@@ -190,7 +199,7 @@ def get_price_target_consensus(symbol: str) -> dict[str, Any]:
     try:
         resp = client.get(f"/price-target-consensus", params={"symbol": symbol})
         resp.raise_for_status()
-        data = resp.json()
+        data = json_loads(resp.content)
         if isinstance(data, list) and data:
             data = data[0]
         if not data:
@@ -221,7 +230,7 @@ def get_multi_news(symbols: list[str], limit: int = 20) -> dict[str, Any]:
             params={"symbols": ",".join(symbols), "limit": limit, "language": "en"},
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = json_loads(resp.content)
         articles = data.get("data", [])
         return {
             "symbols": symbols,
@@ -256,7 +265,9 @@ def get_all_news(symbol: str, days: int = 7) -> dict[str, Any]:
     """Get combined news from all configured sources.
 
     Returns articles, sentiment, analyst grades, and price targets.
-    Skips any API whose key is not configured.
+    Skips any API whose key is not configured. The individual requests are
+    independent, so they run concurrently and the call takes as long as the
+    slowest one.
     """
     has_any_key = any([
         settings.finnhub_api_key,
@@ -271,40 +282,57 @@ def get_all_news(symbol: str, days: int = 7) -> dict[str, Any]:
             )
         }
 
+    fetches: dict[str, Callable[[], dict[str, Any]]] = {}
+    # Clients are created here, on the calling thread, so the workers only
+    # ever read the lazy singletons.
+    if _get_finnhub() is not None:
+        fetches["news"] = lambda: get_company_news(symbol, days)
+        fetches["sentiment"] = lambda: get_news_sentiment(symbol)
+    if _get_fmp() is not None:
+        fetches["grades"] = lambda: get_analyst_grades(symbol)
+        fetches["targets"] = lambda: get_price_target_consensus(symbol)
+    if _get_marketaux() is not None:
+        fetches["multi"] = lambda: get_multi_news([symbol])
+
+    # Every fetcher returns an error dict instead of raising.
+    with ThreadPoolExecutor(max_workers=len(fetches)) as pool:
+        futures = {name: pool.submit(fetch) for name, fetch in fetches.items()}
+    fetched = {name: future.result() for name, future in futures.items()}
+
     result: dict[str, Any] = {"symbol": symbol}
 
     # Finnhub: company news + sentiment
-    if settings.finnhub_api_key:
-        news = get_company_news(symbol, days)
+    if "news" in fetched:
+        news = fetched["news"]
         if "error" not in news:
             result["articles"] = news.get("articles", [])
             result["article_count"] = news.get("count", 0)
         else:
             result["articles_error"] = news["error"]
 
-        sentiment = get_news_sentiment(symbol)
+        sentiment = fetched["sentiment"]
         if "error" not in sentiment:
             result["sentiment"] = sentiment
         else:
             result["sentiment_error"] = sentiment["error"]
 
     # FMP: analyst grades + price targets
-    if settings.fmp_api_key:
-        grades = get_analyst_grades(symbol)
+    if "grades" in fetched:
+        grades = fetched["grades"]
         if "error" not in grades:
             result["analyst_grades"] = grades.get("grades", [])
         else:
             result["grades_error"] = grades["error"]
 
-        targets = get_price_target_consensus(symbol)
+        targets = fetched["targets"]
         if "error" not in targets:
             result["price_targets"] = targets
         else:
             result["targets_error"] = targets["error"]
 
     # Marketaux: multi-symbol news with entity sentiment
-    if settings.marketaux_api_key:
-        multi = get_multi_news([symbol])
+    if "multi" in fetched:
+        multi = fetched["multi"]
         if "error" not in multi:
             result["marketaux_articles"] = multi.get("articles", [])
         else:
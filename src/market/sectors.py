@@ -6,6 +6,8 @@ Single source of truth for symbol→sector mapping used by:
 Commands still use inline copies of SEMICONDUCTOR_SYMBOLS and SECTOR_ETFS
 for now — to be migrated in a future PR.
 """
+from functools import lru_cache
+
 
 # 11 SPDR sector ETFs
 SECTOR_ETFS = {
@@ -30,16 +32,16 @@ SECTOR_BETAS = {
 }
 
 # Crypto symbols (beta ~2.5 vs SPY)
-CRYPTO_SYMBOLS = {
+CRYPTO_SYMBOLS = frozenset({
     'BTC', 'ETH', 'SOL', 'ADA', 'XRP', 'DOGE', 'DOT', 'AVAX', 'LINK',
     'UNI', 'NEAR',
-}
+})
 
 # Semiconductor sub-sector (for concentration checks)
-SEMICONDUCTOR_SYMBOLS = {
+SEMICONDUCTOR_SYMBOLS = frozenset({
     'NVDA', 'AMD', 'ASML', 'AMAT', 'MU', 'TSM', 'QCOM', 'MRVL', 'ARM',
     'SMCI', 'INTC', 'KLAC', 'LRCX', 'ON', 'TXN',
-}
+})
 
 # Symbol → sector ETF mapping
 SYMBOL_SECTOR_MAP = {
@@ -90,6 +92,8 @@ SYMBOL_SECTOR_MAP = {
 }
 
 
+# The maps above are constants, so lookups are memoized per symbol.
+@lru_cache(maxsize=4096)
 def get_sector(symbol: str) -> str:
     """Return sector ETF for a symbol. Returns 'CRYPTO' for crypto, 'OTHER' for unknown."""
     if symbol in CRYPTO_SYMBOLS:
@@ -97,6 +101,7 @@ def get_sector(symbol: str) -> str:
     return SYMBOL_SECTOR_MAP.get(symbol, 'OTHER')
 
 
+@lru_cache(maxsize=4096)
 def get_beta(symbol: str) -> float:
     """Return estimated beta for a symbol vs SPY. Unknown symbols default to 1.0 (market beta)."""
     if symbol in CRYPTO_SYMBOLS:
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from typing import Any
 
 import httpx
+from pydantic import TypeAdapter
 
 from src.api.client import EtoroClient
 from src.api import endpoints
@@ -13,6 +15,7 @@ from src.storage.repositories import PortfolioRepo, InstrumentRepo
 
 
 _client: EtoroClient | None = None
+_POSITIONS_ADAPTER = TypeAdapter(list[Position])
 _log = logging.getLogger(__name__)
 
 
@@ -48,9 +51,9 @@ def enrich_positions_with_rates(positions: list[Position]) -> list[Position]:
 
     rate_map = {r.instrument_id: r.mid for r in rates}
 
-    for p in positions:
-        if (p.current_rate is None or p.current_rate == 0) and p.instrument_id in rate_map:
-            live_price = rate_map[p.instrument_id]
+    for p in needs_rate:
+        live_price = rate_map.get(p.instrument_id)
+        if live_price is not None:
             p.current_rate = live_price
             if p.open_rate and p.open_rate > 0:
                 units = p.amount / p.open_rate
@@ -70,7 +73,7 @@ def get_portfolio() -> PortfolioSummary:
     portfolio_data = data.get("clientPortfolio", data)
 
     positions_raw = portfolio_data.get("positions", portfolio_data.get("Positions", []))
-    positions = [Position.model_validate(p) for p in positions_raw]
+    positions = _POSITIONS_ADAPTER.validate_python(positions_raw)
 
     # Enrich positions with live rates when API returns zeros (e.g. market closed)
     positions = enrich_positions_with_rates(positions)
@@ -87,13 +90,15 @@ def get_portfolio() -> PortfolioSummary:
     )
 
 
-def get_positions_with_symbols() -> list[dict]:
-    portfolio = get_portfolio()
-    inst_repo = InstrumentRepo()
+def get_positions_with_symbols(portfolio: PortfolioSummary | None = None) -> list[dict]:
+    """Positions as display dicts; pass ``portfolio`` to reuse an existing fetch."""
+    if portfolio is None:
+        portfolio = get_portfolio()
+    instruments = InstrumentRepo().get_by_ids(p.instrument_id for p in portfolio.positions)
 
     result = []
     for p in portfolio.positions:
-        inst = inst_repo.get_by_id(p.instrument_id)
+        inst = instruments.get(p.instrument_id)
         symbol = inst["symbol"] if inst else f"ID:{p.instrument_id}"
         name = inst["name"] if inst else ""
         live_price = p.current_rate if p.current_rate else p.open_rate
@@ -121,7 +126,7 @@ def get_positions_with_symbols() -> list[dict]:
 
 def save_snapshot() -> int:
     portfolio = get_portfolio()
-    positions = get_positions_with_symbols()
+    positions = get_positions_with_symbols(portfolio)
     repo = PortfolioRepo()
     return repo.save_snapshot(
         total_value=portfolio.total_value,
@@ -132,9 +137,9 @@ def save_snapshot() -> int:
     )
 
 
-def get_snapshot_history(limit: int = 20) -> list[dict]:
+def get_snapshot_history(limit: int = 20, columns: Iterable[str] | None = None) -> list[dict]:
     repo = PortfolioRepo()
-    return repo.get_snapshots(limit)
+    return repo.get_snapshots(limit, columns=columns)
 
 
 def get_watchlists() -> list[dict]:
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import atexit
 import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
-from config import settings
+from config import get_settings
 
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS portfolio_snapshots (
@@ -65,17 +69,102 @@ CREATE TABLE IF NOT EXISTS daily_pnl (
 );
 """
 
+# Created after migrations, since some index the ``mode`` column that older
+# databases only gain in _MIGRATIONS. Each matches a query in repositories.py.
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_snapshots_ts ON portfolio_snapshots(timestamp);
+CREATE INDEX IF NOT EXISTS idx_snapshots_mode_ts ON portfolio_snapshots(mode, timestamp);
+CREATE INDEX IF NOT EXISTS idx_trade_log_ts ON trade_log(timestamp);
+CREATE INDEX IF NOT EXISTS idx_closes_mode_ts ON position_closes(mode, timestamp);
+CREATE INDEX IF NOT EXISTS idx_memories_rank ON memories(relevance_score DESC, timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_instruments_symbol ON instruments(symbol COLLATE NOCASE);
+"""
 
-def get_connection() -> sqlite3.Connection:
-    db_path = Path(settings.db_path)
+
+# Per-thread connections keyed by database path; sqlite3 connections must
+# not be shared across threads, and the configured path can be overridden
+# (e.g. tests patching get_settings). Demo/real share one file via the mode column.
+_local = threading.local()
+
+
+def _open(db_path: Path) -> sqlite3.Connection:
     db_path.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(str(db_path))
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA foreign_keys=ON")
+    # WAL keeps the database consistent with NORMAL sync; only the last
+    # commits before a power loss can be lost, never the file.
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")
+    # Connections live for the whole process now, so map the file for reads.
+    # Lock waits use sqlite3.connect's default 5 s timeout.
+    conn.execute("PRAGMA mmap_size=268435456")
     return conn
 
 
+def get_connection() -> sqlite3.Connection:
+    """This thread's connection to the configured database, opened on first use.
+
+    The connection is shared by later calls on the same thread, so callers
+    must not close it; use ``connection()`` for rollback on error.
+    """
+    db_path = Path(get_settings().db_path)
+    conns: dict[Path, sqlite3.Connection] = _local.__dict__.setdefault("conns", {})
+    conn = conns.get(db_path)
+    if conn is None:
+        conn = conns[db_path] = _open(db_path)
+    return conn
+
+
+@contextmanager
+def connection() -> Iterator[sqlite3.Connection]:
+    """Borrow this thread's connection, rolling back an open transaction on error.
+
+    Inside a ``transaction()`` the rollback is left to the outermost block, so
+    a caught error here does not discard the batch's earlier writes.
+    """
+    conn = get_connection()
+    try:
+        yield conn
+    except Exception:
+        if not getattr(_local, "depth", 0):
+            conn.rollback()
+        raise
+
+
+@contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """Run the block as one transaction on this thread's connection.
+
+    Repository writes use this too, so wrapping several of them in an outer
+    ``transaction()`` commits them together: nested blocks join the
+    outermost one, which alone commits or rolls back.
+    """
+    conn = get_connection()
+    depth = getattr(_local, "depth", 0)
+    _local.depth = depth + 1
+    try:
+        yield conn
+    except BaseException:
+        if depth == 0:
+            conn.rollback()
+        raise
+    else:
+        if depth == 0:
+            conn.commit()
+    finally:
+        _local.depth = depth
+
+
+@atexit.register
+def close_connections() -> None:
+    """Close the calling thread's connections (checkpoints the WAL on exit)."""
+    for conn in _local.__dict__.pop("conns", {}).values():
+        conn.close()
+
+
 _MIGRATIONS = [
     # Add mode column to tables that predate mode tracking
     ("portfolio_snapshots", "mode", "ALTER TABLE portfolio_snapshots ADD COLUMN mode TEXT NOT NULL DEFAULT 'real'"),
@@ -91,11 +180,22 @@ def _run_migrations(conn: sqlite3.Connection) -> None:
             conn.execute(sql)
 
 
+# Stored in PRAGMA user_version once the schema is in place, so later
+# processes skip the DDL. Bump it whenever SCHEMA, _MIGRATIONS or INDEXES change.
+_SCHEMA_VERSION = 1
+# Databases already initialised by this process.
+_initialized: set[Path] = set()
+
+
 def init_db() -> None:
-    conn = get_connection()
-    try:
-        conn.executescript(SCHEMA)
-        _run_migrations(conn)
-        conn.commit()
-    finally:
-        conn.close()
+    db_path = Path(get_settings().db_path)
+    if db_path in _initialized:
+        return
+    with connection() as conn:
+        if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            conn.executescript(SCHEMA)
+            _run_migrations(conn)
+            conn.executescript(INDEXES)
+            conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+            conn.commit()
+    _initialized.add(db_path)
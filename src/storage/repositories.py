@@ -1,11 +1,34 @@
 from __future__ import annotations
 
 import json
-from datetime import date
+from collections.abc import Iterable, Iterator
+from datetime import date, timedelta
 from typing import Any
 
 from config import settings
-from src.storage.database import get_connection
+from src.storage.database import connection, transaction
+
+# Columns a listing may be narrowed to. Listings that only show a few fields
+# skip the positions_json / result_json payloads this way.
+SNAPSHOT_COLUMNS = (
+    "id", "timestamp", "total_value", "total_invested", "total_pnl",
+    "cash_available", "positions_json", "num_positions", "mode",
+)
+TRADE_COLUMNS = (
+    "id", "timestamp", "instrument_id", "symbol", "direction", "amount",
+    "status", "result_json", "reason", "mode",
+)
+
+
+def _select_list(columns: Iterable[str] | None, allowed: tuple[str, ...]) -> str:
+    """SQL select list for ``columns`` (all when None), checked against ``allowed``."""
+    if columns is None:
+        return "*"
+    columns = list(columns)
+    unknown = set(columns).difference(allowed)
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(sorted(unknown))}")
+    return ", ".join(columns)
 
 
 class PortfolioRepo:
@@ -17,8 +40,7 @@ class PortfolioRepo:
         cash_available: float,
         positions: list[dict],
     ) -> int:
-        conn = get_connection()
-        try:
+        with transaction() as conn:
             cur = conn.execute(
                 """INSERT INTO portfolio_snapshots
                    (total_value, total_invested, total_pnl, cash_available, positions_json, num_positions, mode)
@@ -26,27 +48,27 @@ class PortfolioRepo:
                 (total_value, total_invested, total_pnl, cash_available,
                  json.dumps(positions), len(positions), settings.trading_mode),
             )
-            conn.commit()
             return cur.lastrowid
-        finally:
-            conn.close()
 
-    def get_snapshots(self, limit: int = 20, mode: str | None = None) -> list[dict]:
-        conn = get_connection()
-        try:
+    def get_snapshots(
+        self,
+        limit: int = 20,
+        mode: str | None = None,
+        columns: Iterable[str] | None = None,
+    ) -> list[dict]:
+        select = _select_list(columns, SNAPSHOT_COLUMNS)
+        with connection() as conn:
             if mode:
                 rows = conn.execute(
-                    "SELECT * FROM portfolio_snapshots WHERE mode = ? ORDER BY timestamp DESC LIMIT ?",
+                    f"SELECT {select} FROM portfolio_snapshots WHERE mode = ? ORDER BY timestamp DESC LIMIT ?",
                     (mode, limit),
                 ).fetchall()
             else:
                 rows = conn.execute(
-                    "SELECT * FROM portfolio_snapshots ORDER BY timestamp DESC LIMIT ?",
+                    f"SELECT {select} FROM portfolio_snapshots ORDER BY timestamp DESC LIMIT ?",
                     (limit,),
                 ).fetchall()
             return [dict(r) for r in rows]
-        finally:
-            conn.close()
 
 
 class TradeLogRepo:
@@ -60,8 +82,7 @@ class TradeLogRepo:
         result: dict | None = None,
         reason: str | None = None,
     ) -> int:
-        conn = get_connection()
-        try:
+        with transaction() as conn:
             cur = conn.execute(
                 """INSERT INTO trade_log
                    (instrument_id, symbol, direction, amount, status, result_json, reason, mode)
@@ -69,105 +90,92 @@ class TradeLogRepo:
                 (instrument_id, symbol, direction, amount, status,
                  json.dumps(result) if result else None, reason, settings.trading_mode),
             )
-            conn.commit()
             return cur.lastrowid
-        finally:
-            conn.close()
 
     def log_close(
         self, position_id: int, symbol: str, pnl: float | None, reason: str | None
     ) -> int:
-        conn = get_connection()
-        try:
+        with transaction() as conn:
             cur = conn.execute(
                 "INSERT INTO position_closes (position_id, symbol, pnl, reason, mode) VALUES (?, ?, ?, ?, ?)",
                 (position_id, symbol, pnl, reason, settings.trading_mode),
             )
-            conn.commit()
             return cur.lastrowid
-        finally:
-            conn.close()
 
-    def get_trades(self, limit: int = 50) -> list[dict]:
-        conn = get_connection()
-        try:
-            rows = conn.execute(
-                "SELECT * FROM trade_log ORDER BY timestamp DESC LIMIT ?", (limit,)
-            ).fetchall()
-            return [dict(r) for r in rows]
-        finally:
-            conn.close()
+    def get_trades(self, limit: int = 50, columns: Iterable[str] | None = None) -> list[dict]:
+        return list(self.iter_trades(limit, columns))
+
+    def iter_trades(
+        self, limit: int = 50, columns: Iterable[str] | None = None
+    ) -> Iterator[dict]:
+        """Yield trades newest first straight off the cursor."""
+        select = _select_list(columns, TRADE_COLUMNS)
+        with connection() as conn:
+            for row in conn.execute(
+                f"SELECT {select} FROM trade_log ORDER BY timestamp DESC LIMIT ?", (limit,)
+            ):
+                yield dict(row)
 
     def get_today_stats(self) -> dict:
         """Compute today's realized P&L from position_closes (the only table
         that reliably records close outcomes).  Falls back to 0 if no closes."""
-        today = date.today().isoformat()
-        conn = get_connection()
-        try:
+        day = date.today()
+        today = day.isoformat()
+        # A half-open text range on the stored "YYYY-MM-DD HH:MM:SS" values
+        # matches date(timestamp) = today but can seek idx_closes_mode_ts.
+        tomorrow = (day + timedelta(days=1)).isoformat()
+        with connection() as conn:
             row = conn.execute(
                 """SELECT COALESCE(SUM(pnl), 0) AS realized_pnl,
                           COUNT(*) AS trades_count
                    FROM position_closes
-                   WHERE date(timestamp) = ? AND mode = ?""",
-                (today, settings.trading_mode),
+                   WHERE mode = ? AND timestamp >= ? AND timestamp < ?""",
+                (settings.trading_mode, today, tomorrow),
             ).fetchone()
             return {
                 "date": today,
                 "realized_pnl": row["realized_pnl"] if row else 0,
                 "trades_count": row["trades_count"] if row else 0,
             }
-        finally:
-            conn.close()
 
 
 class MemoryRepo:
     def add(self, category: str, content: str, relevance: float = 1.0) -> int:
-        conn = get_connection()
-        try:
+        with transaction() as conn:
             cur = conn.execute(
                 "INSERT INTO memories (category, content, relevance_score) VALUES (?, ?, ?)",
                 (category, content, relevance),
             )
-            conn.commit()
             return cur.lastrowid
-        finally:
-            conn.close()
 
     def list_all(self, limit: int = 50) -> list[dict]:
-        conn = get_connection()
-        try:
-            rows = conn.execute(
+        return list(self.iter_memories(limit))
+
+    def iter_memories(self, limit: int = 50) -> Iterator[dict]:
+        """Streaming counterpart of ``list_all``."""
+        with connection() as conn:
+            for row in conn.execute(
                 "SELECT * FROM memories ORDER BY relevance_score DESC, timestamp DESC LIMIT ?",
                 (limit,),
-            ).fetchall()
-            return [dict(r) for r in rows]
-        finally:
-            conn.close()
+            ):
+                yield dict(row)
 
     def search(self, query: str) -> list[dict]:
-        conn = get_connection()
-        try:
+        with connection() as conn:
             rows = conn.execute(
                 "SELECT * FROM memories WHERE content LIKE ? ORDER BY relevance_score DESC",
                 (f"%{query}%",),
             ).fetchall()
             return [dict(r) for r in rows]
-        finally:
-            conn.close()
 
     def delete(self, memory_id: int) -> None:
-        conn = get_connection()
-        try:
+        with transaction() as conn:
             conn.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
-            conn.commit()
-        finally:
-            conn.close()
 
 
 class InstrumentRepo:
     def upsert(self, instrument_id: int, symbol: str, name: str, asset_class: str) -> None:
-        conn = get_connection()
-        try:
+        with transaction() as conn:
             conn.execute(
                 """INSERT INTO instruments (instrument_id, symbol, name, asset_class)
                    VALUES (?, ?, ?, ?)
@@ -175,38 +183,61 @@ class InstrumentRepo:
                      symbol=excluded.symbol, name=excluded.name, asset_class=excluded.asset_class""",
                 (instrument_id, symbol, name, asset_class),
             )
-            conn.commit()
-        finally:
-            conn.close()
+
+    def upsert_many(self, rows: Iterable[tuple[int, str, str, str]]) -> None:
+        """Upsert ``(instrument_id, symbol, name, asset_class)`` rows in one transaction."""
+        with transaction() as conn:
+            conn.executemany(
+                """INSERT INTO instruments (instrument_id, symbol, name, asset_class)
+                   VALUES (?, ?, ?, ?)
+                   ON CONFLICT(instrument_id) DO UPDATE SET
+                     symbol=excluded.symbol, name=excluded.name, asset_class=excluded.asset_class""",
+                rows,
+            )
 
     def get_by_symbol(self, symbol: str) -> dict | None:
-        conn = get_connection()
-        try:
+        with connection() as conn:
             row = conn.execute(
                 "SELECT * FROM instruments WHERE symbol = ? COLLATE NOCASE", (symbol,)
             ).fetchone()
             return dict(row) if row else None
-        finally:
-            conn.close()
+
+    def get_by_symbols(self, symbols: list[str]) -> dict[str, dict]:
+        """Cached instruments for ``symbols`` in one query, keyed by upper-cased symbol."""
+        if not symbols:
+            return {}
+        with connection() as conn:
+            placeholders = ",".join("?" * len(symbols))
+            rows = conn.execute(
+                f"SELECT * FROM instruments WHERE symbol COLLATE NOCASE IN ({placeholders})",
+                list(symbols),
+            ).fetchall()
+            return {row["symbol"].upper(): dict(row) for row in rows}
 
     def get_by_id(self, instrument_id: int) -> dict | None:
-        conn = get_connection()
-        try:
+        with connection() as conn:
             row = conn.execute(
                 "SELECT * FROM instruments WHERE instrument_id = ?", (instrument_id,)
             ).fetchone()
             return dict(row) if row else None
-        finally:
-            conn.close()
+
+    def get_by_ids(self, instrument_ids: Iterable[int]) -> dict[int, dict]:
+        """Cached instruments for ``instrument_ids`` in one query, keyed by id."""
+        ids = list(dict.fromkeys(instrument_ids))
+        if not ids:
+            return {}
+        with connection() as conn:
+            placeholders = ",".join("?" * len(ids))
+            rows = conn.execute(
+                f"SELECT * FROM instruments WHERE instrument_id IN ({placeholders})",
+                ids,
+            ).fetchall()
+            return {row["instrument_id"]: dict(row) for row in rows}
 
     def delete_by_symbol(self, symbol: str) -> bool:
-        conn = get_connection()
-        try:
+        with transaction() as conn:
             cur = conn.execute(
                 "DELETE FROM instruments WHERE symbol = ? COLLATE NOCASE", (symbol,)
             )
-            conn.commit()
             return cur.rowcount > 0
-        finally:
-            conn.close()
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import math
 
 import numpy as np
 import pandas as pd
@@ -11,6 +12,17 @@ from src.market.indicators import chandelier_exit, supertrend
 
 _log = logging.getLogger(__name__)
 
+# +1 for long, -1 for short; exact spellings skip the str.upper() fallback.
+_DIRECTION_SIGN = {"BUY": 1.0, "SELL": -1.0, "buy": 1.0, "sell": -1.0}
+
+
+def _direction_sign(direction: str) -> float:
+    """+1.0 for BUY (any case), -1.0 for anything else, as ``upper() == "BUY"``."""
+    sign = _DIRECTION_SIGN.get(direction)
+    if sign is None:
+        sign = 1.0 if direction.upper() == "BUY" else -1.0
+    return sign
+
 
 def calculate_atr_stops(
     price: float,
@@ -48,13 +60,9 @@ def calculate_atr_stops(
 
     tp_pct = (tp_distance / price) * 100
 
-    is_buy = direction.upper() == "BUY"
-    if is_buy:
-        sl_rate = price - sl_distance
-        tp_rate = price + tp_distance
-    else:
-        sl_rate = price + sl_distance
-        tp_rate = price - tp_distance
+    sign = _direction_sign(direction)
+    sl_rate = price - sign * sl_distance
+    tp_rate = price + sign * tp_distance
 
     return {
         "sl_rate": round(sl_rate, 4),
@@ -65,6 +73,48 @@ def calculate_atr_stops(
     }
 
 
+def calculate_atr_stops_batch(
+    prices: np.ndarray,
+    atrs: np.ndarray,
+    directions: np.ndarray,
+    sl_multiplier: float = 2.0,
+    tp_multiplier: float = 3.0,
+    max_sl_pct: float = 15.0,
+    min_sl_pct: float = 1.0,
+) -> dict[str, np.ndarray]:
+    """Vectorized ``calculate_atr_stops`` for scoring many candidates at once.
+
+    Args:
+        prices: Current prices, one per candidate.
+        atrs: ATR values aligned with ``prices``.
+        directions: "BUY" or "SELL" per candidate (case-insensitive).
+        sl_multiplier, tp_multiplier, max_sl_pct, min_sl_pct: As in
+            ``calculate_atr_stops``.
+
+    Returns:
+        dict of arrays sl_rate, tp_rate, sl_pct, tp_pct. Rows where the price
+        or ATR is not > 0 are NaN instead of an error dict.
+    """
+    prices = np.asarray(prices, dtype=float)
+    atrs = np.asarray(atrs, dtype=float)
+    is_buy = np.char.upper(np.asarray(directions, dtype=str)) == "BUY"
+    valid = (prices > 0) & (atrs > 0)
+    prices = np.where(valid, prices, np.nan)
+
+    sl_pct = np.clip(atrs * sl_multiplier / prices * 100, min_sl_pct, max_sl_pct)
+    sl_distance = prices * sl_pct / 100
+    tp_distance = atrs * tp_multiplier
+    tp_pct = tp_distance / prices * 100
+    side = np.where(is_buy, 1.0, -1.0)
+
+    return {
+        "sl_rate": np.round(prices - side * sl_distance, 4),
+        "tp_rate": np.round(prices + side * tp_distance, 4),
+        "sl_pct": np.round(sl_pct, 2),
+        "tp_pct": np.round(tp_pct, 2),
+    }
+
+
 def calculate_chandelier_stops(
     df: pd.DataFrame,
     price: float,
@@ -108,21 +158,23 @@ def calculate_chandelier_stops(
     long_stop, short_stop = chandelier_exit(df, n, mult)
     st_line, st_direction = supertrend(df, supertrend_n, supertrend_mult)
 
-    is_buy = direction.upper() == "BUY"
-    raw_sl = float(long_stop.iloc[-1] if is_buy else short_stop.iloc[-1])
-    trend_up = bool(st_direction.iloc[-1] == 1)
+    sign = _direction_sign(direction)
+    is_buy = sign > 0
+    # Last values straight from the numpy buffers, skipping .iloc.
+    raw_sl = float((long_stop if is_buy else short_stop).to_numpy()[-1])
+    trend_up = bool(st_direction.to_numpy()[-1] == 1)
 
-    if np.isnan(raw_sl):
+    if math.isnan(raw_sl):
         return {"error": "Chandelier stop is NaN (insufficient data)"}
 
     # Clamp distance to min/max percentage of price.
     sl_pct = abs(price - raw_sl) / price * 100
     sl_pct = max(min_sl_pct, min(sl_pct, max_sl_pct))
 
-    sl_rate = price * (1 - sl_pct / 100) if is_buy else price * (1 + sl_pct / 100)
+    sl_rate = price * (1 - sign * sl_pct / 100)
 
-    st_val = float(st_line.iloc[-1])
-    if np.isnan(st_val):
+    st_val = float(st_line.to_numpy()[-1])
+    if math.isnan(st_val):
         return {"error": "SuperTrend line is NaN (insufficient warmup data)"}
 
     return {
@@ -182,15 +234,20 @@ def calculate_position_size(
     if atr <= 0 and sl_distance_pct is None:
         return {"error": "Need either atr > 0 or sl_distance_pct"}
 
-    conviction = conviction.lower()
-    if conviction not in _CONVICTION:
+    # Exact lowercase spellings hit directly; only others are lowered.
+    params = _CONVICTION.get(conviction)
+    if params is None:
+        conviction = conviction.lower()
+        params = _CONVICTION.get(conviction)
+    if params is None:
         _log.warning(
             "Unknown conviction level %r — falling back to 'moderate'. Valid: %s",
             conviction, list(_CONVICTION.keys()),
         )
         conviction = "moderate"
+        params = _CONVICTION[conviction]
 
-    risk_pct, max_concentration = _CONVICTION[conviction]
+    risk_pct, max_concentration = params
     risk_budget = portfolio_value * risk_pct
 
     # Determine SL distance: prefer explicit sl_distance_pct, fall back to 2×ATR.
@@ -2,7 +2,10 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from src.trading.atr_stops import calculate_atr_stops, calculate_chandelier_stops, calculate_position_size
+from src.trading.atr_stops import (
+    calculate_atr_stops, calculate_atr_stops_batch, calculate_chandelier_stops,
+    calculate_position_size,
+)
 
 
 @pytest.fixture
@@ -73,6 +76,20 @@ class TestCalculateAtrStops:
         assert result["sl_rate"] == 202.0  # 200 + 1%
 
 
+class TestCalculateAtrStopsBatch:
+    def test_matches_scalar(self):
+        prices = [100.0, 100.0, 100.0, 200.0, 0.0]
+        atrs = [5.0, 5.0, 20.0, 0.5, 5.0]
+        directions = ["BUY", "sell", "BUY", "SELL", "BUY"]
+        batch = calculate_atr_stops_batch(prices, atrs, directions)
+        for i in range(4):
+            scalar = calculate_atr_stops(prices[i], atrs[i], directions[i])
+            for key in ("sl_rate", "tp_rate", "sl_pct", "tp_pct"):
+                assert batch[key][i] == scalar[key]
+        # Invalid inputs come back as NaN rather than an error dict
+        assert all(np.isnan(batch[key][4]) for key in batch)
+
+
 class TestCalculatePositionSize:
     def test_strong_conviction(self):
         result = calculate_position_size(
@@ -103,6 +120,11 @@ class TestCalculatePositionSize:
         # weak: max 3% concentration = $300
         assert result["amount"] <= 300
 
+    def test_conviction_case_and_unknown(self):
+        kwargs = dict(portfolio_value=10000, cash_available=5000, atr=5, price=100)
+        assert calculate_position_size(conviction="Strong", **kwargs)["conviction"] == "strong"
+        assert calculate_position_size(conviction="bogus", **kwargs)["conviction"] == "moderate"
+
     def test_high_exposure_halving(self):
         normal = calculate_position_size(
             portfolio_value=10000, cash_available=5000,
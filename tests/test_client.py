@@ -0,0 +1,65 @@
+"""Tests for src.api.client — _RateLimiter token bucket and response decoding."""
+from unittest.mock import patch
+
+import httpx
+
+from src.api.client import EtoroClient, _RateLimiter
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+def _limiter(clock, **kwargs):
+    with patch("src.api.client.time", clock):
+        return _RateLimiter(**kwargs)
+
+
+class TestRateLimiter:
+    def test_burst_up_to_capacity_does_not_sleep(self):
+        clock = _Clock()
+        limiter = _limiter(clock, rate=5.0, capacity=5.0)
+        with patch("src.api.client.time", clock):
+            for _ in range(5):
+                limiter.wait()
+        assert clock.sleeps == []
+
+    def test_requests_beyond_burst_are_spaced_at_rate(self):
+        clock = _Clock()
+        limiter = _limiter(clock, rate=5.0, capacity=5.0)
+        with patch("src.api.client.time", clock):
+            for _ in range(7):
+                limiter.wait()
+        assert clock.sleeps == [0.2, 0.4]
+
+    def test_tokens_refill_over_time(self):
+        clock = _Clock()
+        limiter = _limiter(clock, rate=5.0, capacity=5.0)
+        with patch("src.api.client.time", clock):
+            for _ in range(5):
+                limiter.wait()
+            clock.now += 1.0
+            for _ in range(5):
+                limiter.wait()
+        assert clock.sleeps == []
+
+
+class TestEtoroClientDecoding:
+    def test_get_decodes_response_body(self):
+        client = EtoroClient()
+        client._client = httpx.Client(
+            base_url="https://example.test",
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, content=b'{"items": [1, 2]}')
+            ),
+        )
+        with patch.object(client, "_limiter"):
+            assert client.get("/search", q="x") == {"items": [1, 2]}
@@ -0,0 +1,49 @@
+"""Tests for config.set_env_value — .env rewriting used by `config set`."""
+from config import set_env_value
+
+
+def test_replaces_exact_key_only(tmp_path):
+    env = tmp_path / ".env"
+    env.write_text("TRADING_MODE_X=keep\nTRADING_MODE=demo\nOTHER=1\n")
+    set_env_value("TRADING_MODE", "real", env)
+    assert env.read_text() == "TRADING_MODE_X=keep\nTRADING_MODE = real\nOTHER=1\n"
+
+
+def test_appends_missing_key(tmp_path):
+    env = tmp_path / ".env"
+    env.write_text("A=1")
+    set_env_value("B", "2", env)
+    assert env.read_text() == "A=1\nB = 2\n"
+
+
+def test_value_with_backslashes_is_written_verbatim(tmp_path):
+    env = tmp_path / ".env"
+    env.write_text("DB_PATH=old\n")
+    set_env_value("DB_PATH", r"C:\data\1.db", env)
+    assert env.read_text() == "DB_PATH = C:\\data\\1.db\n"
+
+
+def test_large_file_edits_match_small_file_behaviour(tmp_path):
+    env = tmp_path / ".env"
+    filler = "".join(f"FILLER_{i}=x\n" for i in range(1000))
+    env.write_text(filler + "TRADING_MODE_X=keep\nTRADING_MODE=demo\nOTHER = 1\n")
+    set_env_value("TRADING_MODE", "real", env)
+    set_env_value("OTHER", "2", env)  # same length: rewritten in place
+    set_env_value("NEW", "3", env)
+    assert env.read_text() == (
+        filler + "TRADING_MODE_X=keep\nTRADING_MODE = real\nOTHER = 2\nNEW = 3\n"
+    )
+
+
+def test_crlf_file_handled_the_same_by_both_paths(tmp_path):
+    small = tmp_path / "small.env"
+    large = tmp_path / "large.env"
+    filler = "".join(f"FILLER_{i}=x\r\n" for i in range(1000))
+    small.write_bytes(b"TRADING_MODE=demo\r\nOTHER=1\r\n")
+    large.write_bytes(filler.encode() + b"TRADING_MODE=demo\r\nOTHER=1\r\n")
+    for env in (small, large):
+        set_env_value("TRADING_MODE", "real", env)
+        set_env_value("NEW", "3", env)
+    expected = b"TRADING_MODE = real\r\nOTHER=1\r\nNEW = 3\n"
+    assert small.read_bytes() == expected
+    assert large.read_bytes() == filler.encode() + expected
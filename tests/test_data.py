@@ -1,10 +1,24 @@
-"""Tests for src.market.data — analyze_market_regime and _fetch_vix_external."""
+"""Tests for src.market.data — market regime, VIX fetch, symbol and rate lookups."""
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from src.market.data import _build_chandelier_dict, _fetch_vix_external, analyze_market_regime
+from src.market.data import (
+    _SignalSet,
+    _build_chandelier_dict,
+    _fetch_vix_external,
+    analyze_many,
+    analyze_market_regime,
+    clear_caches,
+    get_candles,
+    get_candles_arrays,
+    get_candles_many,
+    get_rates,
+    resolve_symbol,
+    resolve_symbols,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -33,6 +47,25 @@ def _qqq_result(trend="BULLISH", rsi=54.0, price=470.0, sma_20=460.0, sma_50=450
     }
 
 
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    clear_caches()
+    yield
+    clear_caches()
+
+
+@pytest.fixture(autouse=True)
+def _vix_disk_cache(tmp_path):
+    path = tmp_path / "vix_cache.json"
+    with patch("src.market.data._vix_cache_path", return_value=path):
+        yield path
+
+
+def _by_symbol(spy, qqq):
+    """analyze_instrument stand-in keyed by symbol (SPY/QQQ are fetched concurrently)."""
+    return lambda symbol, **kwargs: {"SPY": spy, "QQQ": qqq}[symbol]
+
+
 # ---------------------------------------------------------------------------
 # _fetch_vix_external
 # ---------------------------------------------------------------------------
@@ -119,7 +152,7 @@ class TestAnalyzeMarketRegime:
         spy = _spy_result(trend="BULLISH")
         qqq = _qqq_result(trend="BULLISH")
         with (
-            patch("src.market.data.analyze_instrument", side_effect=[spy, qqq]),
+            patch("src.market.data.analyze_instrument", side_effect=_by_symbol(spy, qqq)),
             patch("src.market.data._fetch_vix_external", return_value=15.0),  # < 16 → LOW
         ):
             regime = analyze_market_regime()
@@ -132,7 +165,7 @@ class TestAnalyzeMarketRegime:
         spy = _spy_result(trend="BEARISH", price=490.0, sma_20=510.0, sma_50=530.0)
         qqq = _qqq_result(trend="BEARISH", price=400.0, sma_20=430.0, sma_50=450.0)
         with (
-            patch("src.market.data.analyze_instrument", side_effect=[spy, qqq]),
+            patch("src.market.data.analyze_instrument", side_effect=_by_symbol(spy, qqq)),
             patch("src.market.data._fetch_vix_external", return_value=38.0),
         ):
             regime = analyze_market_regime()
@@ -158,7 +191,7 @@ class TestAnalyzeMarketRegime:
         spy = _spy_result(trend="BULLISH", price=490.0, sma_20=510.0, sma_50=530.0)
         qqq = _qqq_result(trend="BEARISH")
         with (
-            patch("src.market.data.analyze_instrument", side_effect=[spy, qqq]),
+            patch("src.market.data.analyze_instrument", side_effect=_by_symbol(spy, qqq)),
             patch("src.market.data._fetch_vix_external", return_value=None),
         ):
             regime = analyze_market_regime()
@@ -174,7 +207,7 @@ class TestAnalyzeMarketRegime:
         spy = _spy_result()
         qqq = _qqq_result()
         with (
-            patch("src.market.data.analyze_instrument", side_effect=[spy, qqq]),
+            patch("src.market.data.analyze_instrument", side_effect=_by_symbol(spy, qqq)),
             patch("src.market.data._fetch_vix_external", return_value=22.5),
         ):
             regime = analyze_market_regime()
@@ -187,7 +220,7 @@ class TestAnalyzeMarketRegime:
         with (
             patch(
                 "src.market.data.analyze_instrument",
-                side_effect=[spy, {"error": "QQQ not found"}],
+                side_effect=_by_symbol(spy, {"error": "QQQ not found"}),
             ),
             patch("src.market.data._fetch_vix_external", return_value=18.0),
         ):
@@ -200,7 +233,7 @@ class TestAnalyzeMarketRegime:
         spy = _spy_result()
         qqq = _qqq_result()
         with (
-            patch("src.market.data.analyze_instrument", side_effect=[spy, qqq]),
+            patch("src.market.data.analyze_instrument", side_effect=_by_symbol(spy, qqq)),
             patch("src.market.data._fetch_vix_external", return_value=None),
         ):
             regime = analyze_market_regime()
@@ -217,7 +250,7 @@ class TestAnalyzeMarketRegime:
         spy = _spy_result(trend="BULLISH", price=580.0, sma_20=570.0, sma_50=600.0)
         qqq = _qqq_result(trend="BEARISH")
         with (
-            patch("src.market.data.analyze_instrument", side_effect=[spy, qqq]),
+            patch("src.market.data.analyze_instrument", side_effect=_by_symbol(spy, qqq)),
             patch("src.market.data._fetch_vix_external", return_value=None),
         ):
             regime = analyze_market_regime()
@@ -229,7 +262,7 @@ class TestAnalyzeMarketRegime:
         spy = _spy_result()
         qqq = _qqq_result()
         with (
-            patch("src.market.data.analyze_instrument", side_effect=[spy, qqq]),
+            patch("src.market.data.analyze_instrument", side_effect=_by_symbol(spy, qqq)),
             patch("src.market.data._fetch_vix_external", return_value=27.5),
         ):
             regime = analyze_market_regime()
@@ -242,7 +275,7 @@ class TestAnalyzeMarketRegime:
         spy = _spy_result()
         qqq = _qqq_result()
         with (
-            patch("src.market.data.analyze_instrument", side_effect=[spy, qqq]),
+            patch("src.market.data.analyze_instrument", side_effect=_by_symbol(spy, qqq)),
             patch("src.market.data._fetch_vix_external", return_value=11.5),
         ):
             regime = analyze_market_regime()
@@ -250,6 +283,60 @@ class TestAnalyzeMarketRegime:
         assert regime["vix"]["regime"] == "VERY_LOW"
         assert regime["vix"]["sizing_adjustment"] == 1.0
 
+    def test_repeat_calls_reuse_cached_inputs(self):
+        spy = _spy_result()
+        qqq = _qqq_result()
+        with (
+            patch("src.market.data.analyze_instrument", side_effect=_by_symbol(spy, qqq)) as analyze,
+            patch("src.market.data._fetch_vix_external", return_value=18.0) as vix,
+        ):
+            analyze_market_regime()
+            analyze_market_regime()
+
+        assert analyze.call_count == 2  # SPY + QQQ once each
+        assert vix.call_count == 1
+
+    def test_mutating_regime_output_leaves_cache_intact(self):
+        spy = _spy_result()
+        spy["ma_alignment"] = {"alignment": "GOLDEN"}
+        qqq = _qqq_result()
+        with (
+            patch("src.market.data.analyze_instrument", side_effect=_by_symbol(spy, qqq)),
+            patch("src.market.data._fetch_vix_external", return_value=18.0),
+        ):
+            analyze_market_regime()["spy"]["ma_alignment"]["alignment"] = "changed"
+            regime = analyze_market_regime()
+
+        assert regime["spy"]["ma_alignment"] == {"alignment": "GOLDEN"}
+
+    def test_vix_disk_cache_survives_memory_reset(self, _vix_disk_cache):
+        spy = _spy_result()
+        qqq = _qqq_result()
+        with (
+            patch("src.market.data.analyze_instrument", side_effect=_by_symbol(spy, qqq)),
+            patch("src.market.data._fetch_vix_external", return_value=21.0) as vix,
+        ):
+            analyze_market_regime()
+            clear_caches()
+            regime = analyze_market_regime()
+
+        assert vix.call_count == 1
+        assert regime["vix"]["value"] == 21.0
+        assert _vix_disk_cache.exists()
+
+    def test_failed_vix_is_not_cached(self):
+        spy = _spy_result()
+        qqq = _qqq_result()
+        with (
+            patch("src.market.data.analyze_instrument", side_effect=_by_symbol(spy, qqq)),
+            patch("src.market.data._fetch_vix_external", side_effect=[None, 18.0]) as vix,
+        ):
+            analyze_market_regime()
+            regime = analyze_market_regime()
+
+        assert vix.call_count == 2
+        assert regime["vix"]["value"] == 18.0
+
 
 # ---------------------------------------------------------------------------
 # _build_chandelier_dict
@@ -310,3 +397,179 @@ class TestBuildChandelierDict:
             self._make_series(148.0),
         )
         assert result is None
+
+
+# ---------------------------------------------------------------------------
+# resolve_symbol / resolve_symbols
+# ---------------------------------------------------------------------------
+
+class TestResolveSymbolCache:
+    def test_hit_is_memoized_case_insensitively(self):
+        aapl = {"instrument_id": 1001, "symbol": "AAPL"}
+        with patch("src.market.data.InstrumentRepo") as repo_cls:
+            repo_cls.return_value.get_by_symbol.return_value = aapl
+            assert resolve_symbol("AAPL") == aapl
+            assert resolve_symbol("aapl") == aapl
+        repo_cls.return_value.get_by_symbol.assert_called_once()
+
+    def test_miss_is_not_memoized(self):
+        with patch("src.market.data.InstrumentRepo") as repo_cls, \
+             patch("src.market.data.search_instrument", return_value=[]) as search:
+            repo_cls.return_value.get_by_symbol.return_value = None
+            assert resolve_symbol("NOPE") is None
+            assert resolve_symbol("NOPE") is None
+        assert search.call_count == 2
+
+    def test_memo_is_bounded_lru(self):
+        with patch("src.market.data._SYMBOL_CACHE_SIZE", 2), \
+             patch("src.market.data._resolve_symbol_uncached",
+                   side_effect=lambda sym: {"symbol": sym.upper()}) as uncached:
+            resolve_symbol("A")
+            resolve_symbol("B")
+            resolve_symbol("A")  # refresh A; B is now least recently used
+            resolve_symbol("C")
+            resolve_symbol("A")
+            resolve_symbol("B")
+        assert [c.args[0] for c in uncached.call_args_list] == ["A", "B", "C", "B"]
+
+
+class TestResolveSymbols:
+    def test_cache_hits_skip_search(self):
+        cached = {"AAPL": {"instrument_id": 1001, "symbol": "AAPL"}}
+        with patch("src.market.data.InstrumentRepo") as repo_cls, \
+             patch("src.market.data.resolve_symbol") as single:
+            repo_cls.return_value.get_by_symbols.return_value = cached
+            result = resolve_symbols(["aapl"])
+        assert result == {"aapl": cached["AAPL"]}
+        single.assert_not_called()
+
+    def test_misses_fall_back_to_resolve_symbol(self):
+        msft = {"instrument_id": 1004, "symbol": "MSFT"}
+        with patch("src.market.data.InstrumentRepo") as repo_cls, \
+             patch("src.market.data.resolve_symbol", side_effect=[msft, None]) as single:
+            repo_cls.return_value.get_by_symbols.return_value = {}
+            result = resolve_symbols(["MSFT", "NOPE"])
+        assert result == {"MSFT": msft}
+        assert single.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# get_rates
+# ---------------------------------------------------------------------------
+
+class TestGetRates:
+    @staticmethod
+    def _rate(iid):
+        return {"instrumentID": iid, "bid": 100.0, "ask": 100.5}
+
+    def test_single_request_for_small_batch(self):
+        client = MagicMock()
+        client.get.return_value = {"rates": [self._rate(1), self._rate(2)]}
+        with patch("src.market.data._get_client", return_value=client):
+            rates = get_rates([1, 2])
+        assert [r.instrument_id for r in rates] == [1, 2]
+        client.get.assert_called_once()
+        assert client.get.call_args.kwargs["instrumentIds"] == "1,2"
+
+    def test_large_batches_are_chunked(self):
+        client = MagicMock()
+        client.get.side_effect = lambda path, instrumentIds: {
+            "rates": [self._rate(int(i)) for i in instrumentIds.split(",")]
+        }
+        ids = list(range(1, 121))
+        with patch("src.market.data._get_client", return_value=client):
+            rates = get_rates(ids)
+        assert client.get.call_count == 3
+        assert [r.instrument_id for r in rates] == ids
+
+
+# ---------------------------------------------------------------------------
+# get_candles
+# ---------------------------------------------------------------------------
+
+class TestGetCandles:
+    def _fetch(self, candles):
+        client = MagicMock()
+        client.get.return_value = {"candles": [{"instrumentId": 1, "candles": candles}]}
+        with patch("src.market.data._get_client", return_value=client):
+            return get_candles(1)
+
+    def test_sorted_oldest_first(self):
+        df = self._fetch([
+            {"fromDate": "2024-01-02T00:00:00Z", "open": 2, "high": 3, "low": 1, "close": 2.5, "volume": 20},
+            {"fromDate": "2024-01-01T00:00:00Z", "open": 1, "high": 2, "low": 0.5, "close": 1.5, "volume": 10},
+        ])
+        assert list(df.columns) == ["timestamp", "open", "high", "low", "close", "volume"]
+        assert df["close"].tolist() == [1.5, 2.5]
+        assert df["timestamp"].is_monotonic_increasing
+
+    def test_capitalized_keys(self):
+        df = self._fetch([
+            {"FromDate": "2024-01-01T00:00:00Z", "Open": 1, "High": 2, "Low": 0.5, "Close": 1.5, "Volume": 10},
+        ])
+        assert df["volume"].tolist() == [10]
+
+    def test_empty_response(self):
+        assert self._fetch([]).empty
+
+    def test_many_keyed_by_instrument(self):
+        client = MagicMock()
+        client.get.side_effect = lambda path: {"candles": [{"candles": [
+            {"fromDate": "2024-01-01T00:00:00Z", "open": 1, "high": 2, "low": 0.5,
+             "close": float(path.split("/history")[0].rsplit("/", 1)[1]), "volume": 10},
+        ]}]}
+        with patch("src.market.data._get_client", return_value=client):
+            frames = get_candles_many([7, 8])
+        assert {iid: df["close"].tolist() for iid, df in frames.items()} == {7: [7.0], 8: [8.0]}
+
+    def test_repeat_fetch_within_ttl_is_cached(self):
+        client = MagicMock()
+        client.get.return_value = {"candles": [{"candles": [
+            {"fromDate": "2024-01-01T00:00:00Z", "open": 1, "high": 2, "low": 0.5, "close": 1.5, "volume": 10},
+        ]}]}
+        with patch("src.market.data._get_client", return_value=client):
+            first = get_candles(1, "OneDay", 60)
+            first.loc[0, "close"] = 99.0  # callers get their own copy
+            second = get_candles(1, "OneDay", 60)
+            get_candles(1, "OneDay", 30)
+        assert client.get.call_count == 2
+        assert second["close"].tolist() == [1.5]
+
+    def test_arrays_sorted_and_utc(self):
+        client = MagicMock()
+        client.get.return_value = {"candles": [{"instrumentId": 1, "candles": [
+            {"fromDate": "2024-01-02T00:00:00Z", "open": 2, "high": 3, "low": 1, "close": 2.5, "volume": 20},
+            {"fromDate": "2024-01-01T00:00:00Z", "open": 1, "high": 2, "low": 0.5, "close": 1.5, "volume": 10},
+        ]}]}
+        with patch("src.market.data._get_client", return_value=client):
+            arrays = get_candles_arrays(1)
+        assert arrays["close"].tolist() == [1.5, 2.5]
+        assert arrays["timestamp"][0] == np.datetime64("2024-01-01T00:00:00")
+
+
+class TestSignalSet:
+    def test_trend_follows_polarity_counts(self):
+        signals = _SignalSet()
+        signals.add("RSI oversold (bullish)", +1)
+        signals.add("RVOL 2.1x very high volume")
+        assert signals.trend == "BULLISH"
+        signals.add("SMA20 < SMA50 (bearish)", -1)
+        assert signals.trend == "NEUTRAL"
+        assert len(signals.items) == 3
+
+
+class TestAnalyzeMany:
+    def test_batches_lookups_and_keeps_order(self):
+        infos = {"AAPL": {"instrument_id": 1, "symbol": "AAPL"},
+                 "MSFT": {"instrument_id": 2, "symbol": "MSFT"}}
+        rates = [MagicMock(instrument_id=1, mid=190.0), MagicMock(instrument_id=2, mid=410.0)]
+        done = []
+        with patch("src.market.data.resolve_symbols", return_value=infos), \
+             patch("src.market.data.get_rates", return_value=rates) as get_rates_, \
+             patch("src.market.data.get_candles", return_value=pd.DataFrame()):
+            results = analyze_many(["MSFT", "NOPE", "AAPL"], on_done=done.append)
+
+        get_rates_.assert_called_once_with([2, 1])
+        assert [r.get("price") for r in results] == [410.0, None, 190.0]
+        assert results[1]["error"] == "Instrument 'NOPE' not found"
+        assert sorted(done) == ["AAPL", "MSFT", "NOPE"]
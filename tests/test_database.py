@@ -0,0 +1,107 @@
+import threading
+from datetime import date, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from config import settings
+from src.storage import database
+from src.storage.repositories import MemoryRepo, PortfolioRepo, TradeLogRepo
+
+
+@pytest.fixture(autouse=True)
+def _tmp_db(tmp_path):
+    settings = SimpleNamespace(db_path=str(tmp_path / "test.db"))
+    with patch.object(database, "get_settings", return_value=settings):
+        database.init_db()
+        yield
+        database.close_connections()
+
+
+class TestInitDb:
+    def test_records_schema_version_and_runs_once(self):
+        conn = database.get_connection()
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == database._SCHEMA_VERSION
+        with patch.object(database, "connection") as connection:
+            database.init_db()
+        connection.assert_not_called()
+
+
+class TestConnection:
+    def test_reused_within_thread_only(self):
+        conn = database.get_connection()
+        assert database.get_connection() is conn
+
+        other = []
+        worker = threading.Thread(target=lambda: other.append(database.get_connection()))
+        worker.start()
+        worker.join()
+        assert other[0] is not conn
+
+    def test_rolls_back_on_error(self):
+        with pytest.raises(ValueError):
+            with database.connection() as conn:
+                conn.execute(
+                    "INSERT INTO memories (category, content) VALUES ('lesson', 'x')"
+                )
+                raise ValueError
+        assert MemoryRepo().list_all() == []
+
+    def test_nested_writes_share_outer_transaction(self):
+        repo = MemoryRepo()
+        with pytest.raises(ValueError):
+            with database.transaction():
+                repo.add("lesson", "first")
+                repo.add("lesson", "second")
+                raise ValueError
+        assert repo.list_all() == []
+
+        with database.transaction():
+            repo.add("lesson", "first")
+            repo.add("lesson", "second")
+        assert len(repo.list_all()) == 2
+
+    def test_caught_error_inside_transaction_keeps_batch(self):
+        repo = MemoryRepo()
+        with database.transaction():
+            repo.add("lesson", "first")
+            with pytest.raises(ValueError):
+                with database.connection():
+                    raise ValueError
+            repo.add("lesson", "second")
+        assert len(repo.list_all()) == 2
+
+
+class TestTodayStats:
+    def test_counts_only_todays_closes(self):
+        today = date.today()
+        with database.transaction() as conn:
+            for stamp, pnl in [
+                (f"{today - timedelta(days=1)} 23:59:59", 50.0),
+                (f"{today} 00:00:00", 10.0),
+                (f"{today} 23:59:59", -4.0),
+                (f"{today + timedelta(days=1)} 00:00:00", 70.0),
+            ]:
+                conn.execute(
+                    "INSERT INTO position_closes (timestamp, position_id, symbol, pnl, mode)"
+                    " VALUES (?, 1, 'AAPL', ?, ?)",
+                    (stamp, pnl, settings.trading_mode),
+                )
+
+        stats = TradeLogRepo().get_today_stats()
+        assert stats["trades_count"] == 2
+        assert stats["realized_pnl"] == pytest.approx(6.0)
+
+
+class TestSnapshotColumns:
+    def test_narrowed_listing(self):
+        repo = PortfolioRepo()
+        repo.save_snapshot(1100.0, 1000.0, 100.0, 50.0, [{"symbol": "AAPL"}])
+        (snap,) = repo.get_snapshots(columns=("timestamp", "total_value"))
+        assert set(snap) == {"timestamp", "total_value"}
+        assert snap["total_value"] == 1100.0
+
+    def test_unknown_column_rejected(self):
+        with pytest.raises(ValueError, match="Unknown columns"):
+            PortfolioRepo().get_snapshots(columns=("total_value", "1; DROP TABLE x"))
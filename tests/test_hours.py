@@ -0,0 +1,13 @@
+"""Tests for src.market.hours — next-open calculation."""
+from datetime import date
+
+from src.market.hours import _next_trading_open
+
+
+def test_friday_close_rolls_to_monday():
+    assert _next_trading_open(date(2026, 1, 9)) == "2026-01-12 09:30 ET"
+
+
+def test_skips_holiday_after_weekend():
+    # 2027-01-01 is a Friday holiday, so Thursday's close rolls past the weekend.
+    assert _next_trading_open(date(2026, 12, 31)) == "2027-01-04 09:30 ET"
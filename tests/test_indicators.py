@@ -5,7 +5,8 @@ import pytest
 from src.market.indicators import (
     sma, ema, rsi, macd, bollinger_bands, atr,
     stochastic, adx, obv, support_resistance, fibonacci_retracement,
-    chandelier_exit, supertrend, rvol, ma_alignment,
+    chandelier_exit, supertrend, rvol, ma_alignment, TechnicalContext,
+    true_range,
 )
 
 
@@ -103,6 +104,28 @@ class TestBollingerBands:
         expected = sma(price_series, 20)
         pd.testing.assert_series_equal(middle, expected)
 
+    def test_matches_pandas_rolling(self, price_series):
+        upper, middle, lower = bollinger_bands(price_series, 20, 2.0)
+        std = price_series.rolling(20).std()
+        pd.testing.assert_series_equal(middle, price_series.rolling(20).mean())
+        pd.testing.assert_series_equal(upper, middle + 2.0 * std)
+
+    def test_short_series_is_all_nan(self):
+        assert sma(pd.Series([1.0, 2.0]), 5).isna().all()
+
+
+class TestTechnicalContext:
+    def test_matches_standalone_indicators(self, price_series):
+        ctx = TechnicalContext.from_close(price_series)
+        pd.testing.assert_series_equal(ctx.ema_21, ema(price_series, 21))
+        for got, want in zip(ctx.macd(), macd(price_series)):
+            pd.testing.assert_series_equal(got, want)
+        for got, want in zip(ctx.bollinger_bands(), bollinger_bands(price_series)):
+            pd.testing.assert_series_equal(got, want)
+
+    def test_sma_200_needs_history(self, price_series):
+        assert TechnicalContext.from_close(price_series).sma_200 is None
+
 
 class TestATR:
     def test_atr_positive(self, ohlcv_df):
@@ -114,6 +137,30 @@ class TestATR:
         result = atr(ohlcv_df)
         assert len(result) == len(ohlcv_df)
 
+    def test_true_range_uses_previous_close(self):
+        df = pd.DataFrame({
+            "high": [10.0, 11.0, 9.0],
+            "low": [9.0, 10.5, 8.0],
+            "close": [9.5, 10.8, 8.5],
+        })
+        # bar 1: gap up → |11 - 9.5|; bar 2: gap down → |8 - 10.8|
+        assert true_range(df).tolist() == pytest.approx([1.0, 1.5, 2.8])
+
+    def test_supertrend_accepts_precomputed_atr(self, ohlcv_df):
+        line, direction = supertrend(ohlcv_df, atr_series=atr(ohlcv_df, 14))
+        expected_line, expected_direction = supertrend(ohlcv_df)
+        pd.testing.assert_series_equal(line, expected_line)
+        pd.testing.assert_series_equal(direction, expected_direction)
+
+    def test_shared_true_range_feeds_atr_consumers(self, ohlcv_df):
+        tr = true_range(ohlcv_df)
+        atr_14 = atr(ohlcv_df, tr=tr)
+        pd.testing.assert_series_equal(atr_14, atr(ohlcv_df))
+        pd.testing.assert_series_equal(adx(ohlcv_df, atr_series=atr_14), adx(ohlcv_df))
+        shared = chandelier_exit(ohlcv_df, atr_series=atr(ohlcv_df, 22, tr=tr))
+        for got, expected in zip(shared, chandelier_exit(ohlcv_df)):
+            pd.testing.assert_series_equal(got, expected)
+
 
 class TestStochastic:
     def test_stochastic_range(self, ohlcv_df):
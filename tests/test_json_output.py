@@ -0,0 +1,42 @@
+import datetime as dt
+import json
+import sys
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.cli.json_output import dumps_json
+
+DATA = {
+    "at": dt.datetime(2024, 1, 2),
+    "rsi": float("nan"),
+    "count": np.int64(3),
+    "price": np.float64(1.5),
+    "rows": [{"gap": np.float64("nan")}],
+}
+EXPECTED = {
+    "at": "2024-01-02T00:00:00",
+    "rsi": None,
+    "count": 3,
+    "price": 1.5,
+    "rows": [{"gap": None}],
+}
+
+
+def _stdlib():
+    with patch.dict(sys.modules, {"orjson": None}):
+        return dumps_json(DATA)
+
+
+def test_stdlib_fallback_emits_valid_normalized_json():
+    out = _stdlib()
+    assert b"NaN" not in out
+    assert json.loads(out) == EXPECTED
+
+
+def test_orjson_matches_stdlib_fallback():
+    pytest.importorskip("orjson")
+    out = dumps_json(DATA)
+    assert json.loads(out) == EXPECTED
+    assert out == _stdlib()
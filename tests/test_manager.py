@@ -0,0 +1,64 @@
+from unittest.mock import patch, MagicMock
+
+from src.api.models import Position, PortfolioSummary
+import src.portfolio.manager as manager
+
+
+def _portfolio() -> PortfolioSummary:
+    position = Position.model_validate({
+        "PositionID": 1,
+        "InstrumentID": 100,
+        "IsBuy": True,
+        "Amount": 1000.0,
+        "OpenRate": 100.0,
+        "CurrentRate": 110.0,
+        "NetProfit": 100.0,
+        "Leverage": 1,
+    })
+    return PortfolioSummary(
+        positions=[position], total_invested=1000.0, total_pnl=100.0, cash_available=500.0
+    )
+
+
+class TestSaveSnapshot:
+    def test_fetches_portfolio_once(self):
+        repo = MagicMock()
+        repo.get_by_ids.return_value = {100: {"symbol": "AAPL", "name": "Apple"}}
+        with (
+            patch.object(manager, "get_portfolio", return_value=_portfolio()) as get_portfolio,
+            patch.object(manager, "InstrumentRepo", return_value=repo),
+            patch.object(manager, "PortfolioRepo") as portfolio_repo,
+        ):
+            portfolio_repo.return_value.save_snapshot.return_value = 7
+            assert manager.save_snapshot() == 7
+
+        get_portfolio.assert_called_once()
+        saved = portfolio_repo.return_value.save_snapshot.call_args.kwargs
+        assert [p["symbol"] for p in saved["positions"]] == ["AAPL"]
+        assert saved["total_invested"] == 1000.0
+
+
+class TestEnrichPositionsWithRates:
+    def test_fills_only_unpriced_positions(self):
+        def _position(pid, iid, is_buy, current_rate):
+            return Position.model_validate({
+                "PositionID": pid, "InstrumentID": iid, "IsBuy": is_buy,
+                "Amount": 1000.0, "OpenRate": 100.0, "CurrentRate": current_rate,
+                "NetProfit": 0.0, "Leverage": 1,
+            })
+
+        positions = [
+            _position(1, 100, True, 0),
+            _position(2, 200, False, 0),
+            _position(3, 300, True, 105.0),
+        ]
+        rates = [
+            MagicMock(instrument_id=100, mid=110.0),
+            MagicMock(instrument_id=200, mid=110.0),
+        ]
+        with patch.object(manager, "get_rates", return_value=rates) as get_rates:
+            manager.enrich_positions_with_rates(positions)
+
+        assert sorted(get_rates.call_args.args[0]) == [100, 200]
+        assert [p.current_rate for p in positions] == [110.0, 110.0, 105.0]
+        assert [p.net_profit for p in positions] == [100.0, -100.0, 0.0]
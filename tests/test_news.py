@@ -1,3 +1,6 @@
+import json
+import threading
+
 import pytest
 from unittest.mock import patch, MagicMock
 import httpx
@@ -21,6 +24,7 @@ def _mock_response(json_data, status_code=200):
     resp = MagicMock(spec=httpx.Response)
     resp.status_code = status_code
     resp.json.return_value = json_data
+    resp.content = json.dumps(json_data).encode()
     resp.raise_for_status.return_value = None
     if status_code >= 400:
         resp.raise_for_status.side_effect = httpx.HTTPStatusError(
@@ -280,3 +284,31 @@ class TestGetAllNews:
         # Should NOT have marketaux (key is empty)
         assert "marketaux_articles" not in result
         assert "marketaux_error" not in result
+
+    @patch.object(news_mod.settings, "finnhub_api_key", "test-key")
+    @patch.object(news_mod.settings, "marketaux_api_key", "test-key")
+    @patch.object(news_mod.settings, "fmp_api_key", "test-key")
+    def test_requests_run_concurrently(self):
+        # All five requests must be in flight at once to pass the barrier;
+        # run sequentially, the first one times out and reports an error.
+        barrier = threading.Barrier(5, timeout=5)
+        payloads = {
+            "/company-news": [],
+            "/news-sentiment": {},
+            "/price-target-consensus": [{"targetHigh": 200.0}],
+            "/news/all": {"data": []},
+        }
+
+        def _get(path, *args, **kwargs):
+            barrier.wait()
+            return _mock_response(payloads.get(path, []))
+
+        for name in ("_finnhub", "_fmp", "_marketaux"):
+            client = MagicMock(spec=httpx.Client)
+            client.get.side_effect = _get
+            setattr(news_mod, name, client)
+
+        result = news_mod.get_all_news("AAPL")
+        assert not [key for key in result if key.endswith("_error")]
+        assert result["articles"] == []
+        assert result["marketaux_articles"] == []